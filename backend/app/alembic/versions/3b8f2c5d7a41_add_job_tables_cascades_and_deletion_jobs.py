@@ -0,0 +1,78 @@
+"""Add job tables with cascading deletes, pending deletion flags and deletion jobs
+
+Revision ID: 3b8f2c5d7a41
+Revises: 1a31ce608336
+Create Date: 2026-10-19 09:12:41.318204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+# revision identifiers, used by Alembic.
+revision = '3b8f2c5d7a41'
+down_revision = '1a31ce608336'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # jobposting and userjob were created by metadata.create_all until now,
+    # so they may or may not exist yet
+    inspector = sa.inspect(op.get_bind())
+    tables = inspector.get_table_names()
+
+    if 'jobposting' not in tables:
+        op.create_table('jobposting',
+            sa.Column('id', sa.Uuid(), nullable=False),
+            sa.Column('title', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+            sa.Column('description', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+            sa.PrimaryKeyConstraint('id')
+        )
+    if 'userjob' not in tables:
+        op.create_table('userjob',
+            sa.Column('id', sa.Uuid(), nullable=False),
+            sa.Column('user_id', sa.Uuid(), nullable=False),
+            sa.Column('job_posting_id', sa.Uuid(), nullable=False),
+            sa.Column('status', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+            sa.ForeignKeyConstraint(['job_posting_id'], ['jobposting.id'], ondelete='CASCADE'),
+            sa.ForeignKeyConstraint(['user_id'], ['user.id'], ondelete='CASCADE'),
+            sa.PrimaryKeyConstraint('id')
+        )
+    else:
+        for fk in inspector.get_foreign_keys('userjob'):
+            op.drop_constraint(fk['name'], 'userjob', type_='foreignkey')
+        op.create_foreign_key('userjob_user_id_fkey', 'userjob', 'user', ['user_id'], ['id'], ondelete='CASCADE')
+        op.create_foreign_key('userjob_job_posting_id_fkey', 'userjob', 'jobposting', ['job_posting_id'], ['id'], ondelete='CASCADE')
+
+    # Chunked deletes look dependents up by their foreign keys
+    op.create_index(op.f('ix_userjob_user_id'), 'userjob', ['user_id'], unique=False)
+    op.create_index(op.f('ix_userjob_job_posting_id'), 'userjob', ['job_posting_id'], unique=False)
+    op.create_index(op.f('ix_item_owner_id'), 'item', ['owner_id'], unique=False)
+
+    op.add_column('user', sa.Column('pending_deletion', sa.Boolean(), server_default=sa.false(), nullable=False))
+    op.add_column('jobposting', sa.Column('pending_deletion', sa.Boolean(), server_default=sa.false(), nullable=False))
+
+    op.create_table('deletionjob',
+        sa.Column('id', sa.Uuid(), nullable=False),
+        sa.Column('target_type', sqlmodel.sql.sqltypes.AutoString(length=32), nullable=False),
+        sa.Column('target_id', sa.Uuid(), nullable=False),
+        sa.Column('status', sqlmodel.sql.sqltypes.AutoString(length=32), nullable=False),
+        sa.Column('deleted_rows', sa.Integer(), nullable=False),
+        sa.Column('error', sqlmodel.sql.sqltypes.AutoString(length=255), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade():
+    op.drop_table('deletionjob')
+    op.drop_column('jobposting', 'pending_deletion')
+    op.drop_column('user', 'pending_deletion')
+    op.drop_index(op.f('ix_item_owner_id'), table_name='item')
+    op.drop_index(op.f('ix_userjob_job_posting_id'), table_name='userjob')
+    op.drop_index(op.f('ix_userjob_user_id'), table_name='userjob')
+    op.drop_constraint('userjob_job_posting_id_fkey', 'userjob', type_='foreignkey')
+    op.drop_constraint('userjob_user_id_fkey', 'userjob', type_='foreignkey')
+    op.create_foreign_key('userjob_user_id_fkey', 'userjob', 'user', ['user_id'], ['id'])
+    op.create_foreign_key('userjob_job_posting_id_fkey', 'userjob', 'jobposting', ['job_posting_id'], ['id'])
@@ -0,0 +1,31 @@
+"""Add phone number to user
+
+Revision ID: 6e0d4f1a9c27
+Revises: 3b8f2c5d7a41
+Create Date: 2026-10-19 11:03:27.540912
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+# revision identifiers, used by Alembic.
+revision = '6e0d4f1a9c27'
+down_revision = '3b8f2c5d7a41'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # The column was only ever created by metadata.create_all, which workers
+    # no longer run, so databases built from migrations may lack it
+    columns = [c['name'] for c in sa.inspect(op.get_bind()).get_columns('user')]
+    if 'phone_number' not in columns:
+        op.add_column('user', sa.Column('phone_number', sqlmodel.sql.sqltypes.AutoString(length=25), nullable=True))
+        op.create_index(op.f('ix_user_phone_number'), 'user', ['phone_number'], unique=False)
+
+
+def downgrade():
+    op.drop_index(op.f('ix_user_phone_number'), table_name='user')
+    op.drop_column('user', 'phone_number')
@@ -0,0 +1,28 @@
+"""Add canonical id to job posting
+
+Revision ID: 8c2e7b4f1d93
+Revises: 6e0d4f1a9c27
+Create Date: 2026-10-19 14:22:08.317465
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8c2e7b4f1d93'
+down_revision = '6e0d4f1a9c27'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('jobposting', sa.Column('canonical_id', sa.Uuid(), nullable=True))
+    op.create_index(op.f('ix_jobposting_canonical_id'), 'jobposting', ['canonical_id'], unique=False)
+    op.create_foreign_key('jobposting_canonical_id_fkey', 'jobposting', 'jobposting', ['canonical_id'], ['id'], ondelete='SET NULL')
+
+
+def downgrade():
+    op.drop_constraint('jobposting_canonical_id_fkey', 'jobposting', type_='foreignkey')
+    op.drop_index(op.f('ix_jobposting_canonical_id'), table_name='jobposting')
+    op.drop_column('jobposting', 'canonical_id')
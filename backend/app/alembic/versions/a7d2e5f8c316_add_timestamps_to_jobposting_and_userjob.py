@@ -0,0 +1,31 @@
+"""Add timestamps to job posting and user job
+
+Revision ID: a7d2e5f8c316
+Revises: f3b7c1e9a2d4
+Create Date: 2026-10-19 19:38:44.120587
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a7d2e5f8c316'
+down_revision = 'f3b7c1e9a2d4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    for table in ('jobposting', 'userjob'):
+        # Existing rows are stamped with the time of the migration
+        op.add_column(table, sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False))
+        op.add_column(table, sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False))
+        op.create_index(f'ix_{table}_created_at', table, ['created_at'], unique=False, postgresql_using='brin')
+
+
+def downgrade():
+    for table in ('userjob', 'jobposting'):
+        op.drop_index(f'ix_{table}_created_at', table_name=table, postgresql_using='brin')
+        op.drop_column(table, 'updated_at')
+        op.drop_column(table, 'created_at')
@@ -0,0 +1,38 @@
+"""Add outbox event table
+
+Revision ID: b5e1f9c7d248
+Revises: a7d2e5f8c316
+Create Date: 2026-10-19 21:14:56.380192
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+# revision identifiers, used by Alembic.
+revision = 'b5e1f9c7d248'
+down_revision = 'a7d2e5f8c316'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'outboxevent',
+        sa.Column('id', sa.BigInteger(), nullable=False),
+        sa.Column('event_type', sqlmodel.sql.sqltypes.AutoString(length=64), nullable=False),
+        sa.Column('job_posting_id', sa.Uuid(), nullable=False),
+        sa.Column('payload', sa.JSON(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('dispatched_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('attempts', sa.Integer(), nullable=False),
+        sa.Column('last_error', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_outboxevent_undelivered', 'outboxevent', ['id'], unique=False, postgresql_where=sa.text('dispatched_at IS NULL'))
+
+
+def downgrade():
+    op.drop_index('ix_outboxevent_undelivered', table_name='outboxevent', postgresql_where=sa.text('dispatched_at IS NULL'))
+    op.drop_table('outboxevent')
@@ -0,0 +1,45 @@
+"""Add closed postings and the application archive
+
+Revision ID: c8f4a2d6e017
+Revises: b5e1f9c7d248
+Create Date: 2026-10-19 22:03:41.518274
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+# revision identifiers, used by Alembic.
+revision = 'c8f4a2d6e017'
+down_revision = 'b5e1f9c7d248'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('jobposting', sa.Column('closed_at', sa.DateTime(timezone=True), nullable=True))
+    op.create_index(op.f('ix_jobposting_closed_at'), 'jobposting', ['closed_at'], unique=False)
+    op.create_table(
+        'userjobarchive',
+        sa.Column('id', sa.Uuid(), nullable=False),
+        sa.Column('user_id', sa.Uuid(), nullable=False),
+        sa.Column('job_posting_id', sa.Uuid(), nullable=False),
+        sa.Column('status', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('archived_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['job_posting_id'], ['jobposting.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['user_id'], ['user.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(op.f('ix_userjobarchive_job_posting_id'), 'userjobarchive', ['job_posting_id'], unique=False)
+    op.create_index('ix_userjobarchive_user_id_id', 'userjobarchive', ['user_id', 'id'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_userjobarchive_user_id_id', table_name='userjobarchive')
+    op.drop_index(op.f('ix_userjobarchive_job_posting_id'), table_name='userjobarchive')
+    op.drop_table('userjobarchive')
+    op.drop_index(op.f('ix_jobposting_closed_at'), table_name='jobposting')
+    op.drop_column('jobposting', 'closed_at')
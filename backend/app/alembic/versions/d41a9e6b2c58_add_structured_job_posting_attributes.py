@@ -0,0 +1,43 @@
+"""Add structured job posting attributes
+
+Revision ID: d41a9e6b2c58
+Revises: 8c2e7b4f1d93
+Create Date: 2026-10-19 16:47:31.902214
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+# revision identifiers, used by Alembic.
+revision = 'd41a9e6b2c58'
+down_revision = '8c2e7b4f1d93'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('jobposting', sa.Column('location', sqlmodel.sql.sqltypes.AutoString(length=255), nullable=True))
+    op.add_column('jobposting', sa.Column('employment_type', sqlmodel.sql.sqltypes.AutoString(length=20), nullable=True))
+    op.add_column('jobposting', sa.Column('salary_min', sa.Integer(), nullable=True))
+    op.add_column('jobposting', sa.Column('salary_max', sa.Integer(), nullable=True))
+    # Existing postings count as posted now, the application sets it from then on
+    op.add_column('jobposting', sa.Column('posted_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False))
+    op.alter_column('jobposting', 'posted_at', server_default=None)
+    op.create_index(op.f('ix_jobposting_posted_at'), 'jobposting', ['posted_at'], unique=False)
+    op.create_index('ix_jobposting_employment_type_posted_at', 'jobposting', ['employment_type', 'posted_at'], unique=False)
+    op.create_index('ix_jobposting_location_posted_at', 'jobposting', ['location', 'posted_at'], unique=False)
+    op.create_index('ix_jobposting_salary_min_salary_max', 'jobposting', ['salary_min', 'salary_max'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_jobposting_salary_min_salary_max', table_name='jobposting')
+    op.drop_index('ix_jobposting_location_posted_at', table_name='jobposting')
+    op.drop_index('ix_jobposting_employment_type_posted_at', table_name='jobposting')
+    op.drop_index(op.f('ix_jobposting_posted_at'), table_name='jobposting')
+    op.drop_column('jobposting', 'posted_at')
+    op.drop_column('jobposting', 'salary_max')
+    op.drop_column('jobposting', 'salary_min')
+    op.drop_column('jobposting', 'employment_type')
+    op.drop_column('jobposting', 'location')
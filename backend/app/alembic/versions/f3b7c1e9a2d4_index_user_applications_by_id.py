@@ -0,0 +1,26 @@
+"""Index a user's applications by id
+
+Revision ID: f3b7c1e9a2d4
+Revises: d41a9e6b2c58
+Create Date: 2026-10-19 18:05:12.661043
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'f3b7c1e9a2d4'
+down_revision = 'd41a9e6b2c58'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # The composite index also serves lookups by user_id alone
+    op.create_index('ix_userjob_user_id_id', 'userjob', ['user_id', 'id'], unique=False)
+    op.drop_index(op.f('ix_userjob_user_id'), table_name='userjob')
+
+
+def downgrade():
+    op.create_index(op.f('ix_userjob_user_id'), 'userjob', ['user_id'], unique=False)
+    op.drop_index('ix_userjob_user_id_id', table_name='userjob')
@@ -3,7 +3,15 @@ from app.api.routes.job_postings import router as job_postings_router
 from app.api.routes.user_jobs import router as user_jobs_router 
 
 
-from app.api.routes import items, login, private, users, utils
+from app.api.routes import (
+    deletion_jobs,
+    events,
+    items,
+    login,
+    private,
+    users,
+    utils,
+)
 from app.core.config import settings
 
 api_router = APIRouter()
@@ -13,6 +21,8 @@ api_router.include_router(utils.router)
 api_router.include_router(items.router)
 api_router.include_router(job_postings_router)
 api_router.include_router(user_jobs_router)
+api_router.include_router(deletion_jobs.router)
+api_router.include_router(events.router)
 
 
 if settings.ENVIRONMENT == "local":
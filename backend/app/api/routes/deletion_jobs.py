@@ -0,0 +1,24 @@
+import uuid
+from typing import Any
+
+from fastapi import APIRouter, Depends, HTTPException
+
+from app.api.deps import SessionDep, get_current_user
+from app.models import DeletionJob, DeletionJobPublic
+
+router = APIRouter(prefix="/deletion-jobs", tags=["deletion-jobs"])
+
+
+@router.get(
+    "/{id}",
+    dependencies=[Depends(get_current_user)],
+    response_model=DeletionJobPublic,
+)
+def read_deletion_job(session: SessionDep, id: uuid.UUID) -> Any:
+    """
+    Get the progress of a background deletion.
+    """
+    job = session.get(DeletionJob, id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Deletion job not found")
+    return job
@@ -0,0 +1,53 @@
+import asyncio
+import uuid
+from collections.abc import AsyncIterator
+
+from fastapi import APIRouter, Query, Request
+from fastapi.responses import StreamingResponse
+
+from app.core.events import RESYNC, event_broker, format_sse
+
+router = APIRouter(prefix="/events", tags=["events"])
+
+# Comment lines sent on idle streams so proxies don't time them out
+HEARTBEAT_SECONDS = 15.0
+
+
+@router.get("/stream")
+async def stream_events(
+    request: Request,
+    user_id: uuid.UUID | None = Query(
+        None, description="Also receive this user's application changes"
+    ),
+) -> StreamingResponse:
+    """
+    Server-Sent Events stream of job posting changes, and of the given user's
+    application changes, as small deltas. Clients load the full lists once and
+    apply these on top, reloading only when sent a resync event.
+    """
+    subscriber_id, subscriber = event_broker.subscribe(user_id)
+
+    async def generate() -> AsyncIterator[str]:
+        try:
+            yield "retry: 3000\n\n"
+            while not await request.is_disconnected():
+                if subscriber.overflowed:
+                    # Too far behind, start over from a full reload
+                    while not subscriber.queue.empty():
+                        subscriber.queue.get_nowait()
+                    subscriber.overflowed = False
+                    yield format_sse(RESYNC, "{}")
+                try:
+                    yield await asyncio.wait_for(
+                        subscriber.queue.get(), HEARTBEAT_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    yield ": heartbeat\n\n"
+        finally:
+            event_broker.unsubscribe(subscriber_id)
+
+    return StreamingResponse(
+        generate(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
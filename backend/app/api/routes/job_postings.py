@@ -1,24 +1,291 @@
 # filepath: /Users/khushi/Desktop/RoleCall/backend/app/api/job_postings.py
+import uuid
+
+from datetime import datetime, timezone
+from typing import Literal
+
 from fastapi import APIRouter
-from sqlmodel import select
-from app.models import JobPosting
-from app.db import get_session
+from sqlalchemy import ColumnElement, func, tuple_
+from sqlmodel import Session, col, select
+from app.models import (
+    DeletionJobPublic,
+    EmploymentType,
+    FacetCount,
+    JobPosting,
+    JobPostingBase,
+    JobPostingCreate,
+    JobPostingDuplicate,
+    JobPostingFacets,
+    JobPostingPublic,
+    JobPostingsBulkCreate,
+    JobPostingsBulkCreated,
+    JobPostingsSearchResults,
+    JobPostingUpdate,
+    JobTitleSuggestion,
+    SimilarJobPosting,
+)
 from app.api.deps import SessionDep
-from fastapi import APIRouter, HTTPException  
+from app.core.config import settings
+from app.core.deletion import run_deletion_job, start_deletion
+from app.core.duplicates import DuplicateIndex, duplicate_index
+from app.core.events import POSTING_CREATED, POSTING_DELETED, POSTING_UPDATED, notify
+from app.core.posting_indexes import (
+    ensure_posting_indexes,
+    index_posting,
+    unindex_posting,
+)
+from app.core.similarity import similarity_index
+from app.core.typeahead import title_index
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Query, Response
 
 
 router = APIRouter(prefix="/job_postings", tags=["job_postings"])
 
-@router.post("/", response_model=JobPosting,tags=["job_postings"])
-def create_job_posting(job_posting: JobPosting, session: SessionDep):
+# Most values returned per facet
+FACET_LIMIT = 50
+
+DuplicatePolicy = Literal["warn", "reject", "link"]
+OnDuplicate = Query(
+    None,
+    description="What to do with a near-duplicate posting: warn through the "
+    "X-Duplicate-Of header, reject it with a 409 or link it to the original. "
+    "Defaults to JOB_POSTING_DUPLICATE_POLICY.",
+)
+
+
+def _find_duplicate(
+    session: Session, job_data: JobPostingBase, exclude: uuid.UUID | None = None
+) -> tuple[uuid.UUID, float] | None:
+    ensure_posting_indexes(session)
+    return duplicate_index.find(
+        job_data.title,
+        job_data.description,
+        settings.JOB_POSTING_DUPLICATE_THRESHOLD,
+        exclude=exclude,
+    )
+
+
+def _notify_posting(session: Session, event_type: str, job_posting: JobPosting) -> None:
+    # Sent on commit; timestamps are left out as the database sets them then
+    data = JobPostingPublic.model_validate(job_posting).model_dump(
+        mode="json", exclude={"created_at", "updated_at"}
+    )
+    notify(session, event_type, data)
+
+
+def _canonical_ids(session: Session, ids: set[uuid.UUID]) -> dict[uuid.UUID, uuid.UUID]:
+    # Link to the original a duplicate points at, so chains stay one level deep
+    rows = session.exec(
+        select(JobPosting.id, JobPosting.canonical_id).where(col(JobPosting.id).in_(ids))
+    ).all()
+    return {posting_id: canonical_id or posting_id for posting_id, canonical_id in rows}
+
+
+@router.post("/", response_model=JobPostingPublic,tags=["job_postings"])
+def create_job_posting(
+    job_in: JobPostingCreate,
+    session: SessionDep,
+    response: Response,
+    on_duplicate: DuplicatePolicy | None = OnDuplicate,
+):
+    policy = on_duplicate or settings.JOB_POSTING_DUPLICATE_POLICY
+    match = _find_duplicate(session, job_in)
+    if match and policy == "reject":
+        raise HTTPException(
+            status_code=409,
+            detail=f"Job posting is a near-duplicate of {match[0]}",
+        )
+
+    job_posting = JobPosting.model_validate(job_in)
+    if match:
+        response.headers["X-Duplicate-Of"] = str(match[0])
+        if policy == "link":
+            job_posting.canonical_id = _canonical_ids(session, {match[0]}).get(match[0])
     session.add(job_posting)
+    _notify_posting(session, POSTING_CREATED, job_posting)
     session.commit()
     session.refresh(job_posting)
+    index_posting(job_posting)
     return job_posting
 
-@router.get("/", response_model=list[JobPosting],tags=["job_postings"])
-def read_job_postings(session: SessionDep):
-    return session.query(JobPosting).all()
+@router.post("/bulk", response_model=JobPostingsBulkCreated, tags=["job_postings"])
+def create_job_postings(
+    job_postings_in: JobPostingsBulkCreate,
+    session: SessionDep,
+    on_duplicate: DuplicatePolicy | None = OnDuplicate,
+):
+    """
+    Import job postings in one transaction, checking each one against the
+    existing postings and the ones earlier in the list. Near-duplicates are
+    reported, and left out when the policy is reject.
+    """
+    policy = on_duplicate or settings.JOB_POSTING_DUPLICATE_POLICY
+    ensure_posting_indexes(session)
+    threshold = settings.JOB_POSTING_DUPLICATE_THRESHOLD
+    batch_index = DuplicateIndex()
+    job_postings: list[JobPosting] = []
+    duplicates: list[JobPostingDuplicate] = []
+    for i, job_in in enumerate(job_postings_in.job_postings):
+        job_posting = JobPosting.model_validate(job_in)
+        matches = [
+            index.find(job_in.title, job_in.description, threshold)
+            for index in (duplicate_index, batch_index)
+        ]
+        match = max((m for m in matches if m), key=lambda m: m[1], default=None)
+        if match:
+            duplicates.append(
+                JobPostingDuplicate(
+                    index=i, duplicate_of=match[0], similarity=match[1]
+                )
+            )
+            if policy == "reject":
+                continue
+            if policy == "link":
+                # Resolved to the original below, in a single query
+                job_posting.canonical_id = match[0]
+        batch_index.add(job_posting.id, job_posting.title, job_posting.description)
+        job_postings.append(job_posting)
+
+    batch = {job_posting.id: job_posting for job_posting in job_postings}
+    canonical_ids = _canonical_ids(
+        session,
+        {jp.canonical_id for jp in job_postings if jp.canonical_id} - batch.keys(),
+    )
+    for job_posting in job_postings:
+        if job_posting.canonical_id in batch:
+            original = batch[job_posting.canonical_id]
+            job_posting.canonical_id = original.canonical_id or original.id
+        elif job_posting.canonical_id:
+            job_posting.canonical_id = canonical_ids.get(job_posting.canonical_id)
+
+    session.add_all(job_postings)
+    for job_posting in job_postings:
+        _notify_posting(session, POSTING_CREATED, job_posting)
+    session.commit()
+    for job_posting in job_postings:
+        session.refresh(job_posting)
+        index_posting(job_posting)
+    return JobPostingsBulkCreated(data=job_postings, duplicates=duplicates)
+
+def _created_between(since: datetime | None, until: datetime | None) -> list[ColumnElement[bool]]:
+    # Served by the BRIN index on created_at
+    filters = []
+    if since is not None:
+        filters.append(col(JobPosting.created_at) >= since)
+    if until is not None:
+        filters.append(col(JobPosting.created_at) < until)
+    return filters
+
+
+@router.get("/", response_model=list[JobPostingPublic],tags=["job_postings"])
+def read_job_postings(
+    session: SessionDep,
+    include_duplicates: bool = False,
+    since: datetime | None = Query(None, description="Created at or after"),
+    until: datetime | None = Query(None, description="Created before"),
+):
+    statement = select(JobPosting).where(
+        col(JobPosting.pending_deletion).is_(False), *_created_between(since, until)
+    )
+    if not include_duplicates:
+        # Postings linked to an original are hidden unless asked for
+        statement = statement.where(col(JobPosting.canonical_id).is_(None))
+    return session.exec(statement).all()
+
+@router.get(
+    "/search", response_model=JobPostingsSearchResults, tags=["job_postings"]
+)
+def search_job_postings(
+    session: SessionDep,
+    location: str | None = None,
+    employment_type: EmploymentType | None = None,
+    salary_min: int | None = Query(None, ge=0),
+    salary_max: int | None = Query(None, ge=0),
+    include_duplicates: bool = False,
+    since: datetime | None = Query(None, description="Created at or after"),
+    until: datetime | None = Query(None, description="Created before"),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+):
+    """
+    Filter job postings by their structured attributes, newest first. Salary
+    filters match postings whose range overlaps the requested one. Facet counts
+    cover every matching posting, not just the page.
+    """
+    filters = [col(JobPosting.pending_deletion).is_(False), *_created_between(since, until)]
+    if not include_duplicates:
+        filters.append(col(JobPosting.canonical_id).is_(None))
+    if location is not None:
+        filters.append(col(JobPosting.location) == location)
+    if employment_type is not None:
+        filters.append(col(JobPosting.employment_type) == employment_type)
+    if salary_min is not None:
+        filters.append(col(JobPosting.salary_max) >= salary_min)
+    if salary_max is not None:
+        filters.append(col(JobPosting.salary_min) <= salary_max)
+
+    page = session.exec(
+        select(JobPosting)
+        .where(*filters)
+        .order_by(col(JobPosting.posted_at).desc(), col(JobPosting.id).desc())
+        .offset(skip)
+        .limit(limit)
+    ).all()
+
+    # Both facets and the total in a single scan: grouping() tells which
+    # grouping set a row belongs to, 1 for location, 2 for employment type
+    # and 3 for the grand total
+    location_col = col(JobPosting.location)
+    employment_type_col = col(JobPosting.employment_type)
+    rows = session.exec(
+        select(
+            location_col,
+            employment_type_col,
+            func.grouping(location_col, employment_type_col),
+            func.count(),
+        )
+        .where(*filters)
+        .group_by(
+            func.grouping_sets(
+                tuple_(location_col), tuple_(employment_type_col), tuple_()
+            )
+        )
+    ).all()
+    count = 0
+    facets: dict[int, list[FacetCount]] = {1: [], 2: []}
+    for location_value, employment_type_value, grouping, group_count in rows:
+        if grouping == 3:
+            count = group_count
+        elif grouping == 1:
+            facets[1].append(FacetCount(value=location_value, count=group_count))
+        else:
+            facets[2].append(FacetCount(value=employment_type_value, count=group_count))
+    for values in facets.values():
+        values.sort(key=lambda facet: (-facet.count, facet.value or ""))
+        del values[FACET_LIMIT:]
+
+    return JobPostingsSearchResults(
+        data=page,
+        count=count,
+        facets=JobPostingFacets(location=facets[1], employment_type=facets[2]),
+    )
+
+@router.get(
+    "/autocomplete",
+    response_model=list[JobTitleSuggestion],
+    tags=["job_postings"],
+)
+def autocomplete_job_titles(
+    session: SessionDep,
+    q: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(10, ge=1, le=50),
+):
+    """Suggest job titles with a word starting with q, most applied to first"""
+    ensure_posting_indexes(session)
+    return [
+        JobTitleSuggestion(title=title, applicants=applicants)
+        for title, applicants in title_index.complete(q, limit)
+    ]
 
 @router.delete("/{job_id}", tags=["job_postings"])
 def delete_job_posting(job_id: str, session: SessionDep):
@@ -31,25 +298,107 @@ def delete_job_posting(job_id: str, session: SessionDep):
     
     # Delete the job posting
     session.delete(job_posting)
+    notify(session, POSTING_DELETED, {"id": str(job_posting.id)})
     session.commit()
+    unindex_posting(job_posting.id)
     
     return {"message": "Job posting deleted successfully"}
 
-@router.put("/{job_id}", response_model=JobPosting, tags=["job_postings"])
-def update_job_posting(job_id: str, job_data: JobPosting, session: SessionDep):
+@router.put("/{job_id}", response_model=JobPostingPublic, tags=["job_postings"])
+def update_job_posting(
+    job_id: uuid.UUID,
+    job_data: JobPostingUpdate,
+    session: SessionDep,
+    response: Response,
+    on_duplicate: DuplicatePolicy | None = OnDuplicate,
+):
     # Find the job posting
     statement = select(JobPosting).where(JobPosting.id == job_id)
     job_posting = session.exec(statement).first()
     
-    if not job_posting:
+    if not job_posting or job_posting.pending_deletion:
         raise HTTPException(status_code=404, detail="Job posting not found")
     
+    policy = on_duplicate or settings.JOB_POSTING_DUPLICATE_POLICY
+    match = _find_duplicate(session, job_data, exclude=job_posting.id)
+    if match and policy == "reject":
+        raise HTTPException(
+            status_code=409,
+            detail=f"Job posting is a near-duplicate of {match[0]}",
+        )
+    if match:
+        response.headers["X-Duplicate-Of"] = str(match[0])
+    if policy == "link":
+        # The edit may have made the posting a duplicate or original again
+        canonical_id = _canonical_ids(session, {match[0]}).get(match[0]) if match else None
+        job_posting.canonical_id = canonical_id if canonical_id != job_posting.id else None
+    
     # Update the job posting
-    job_posting.title = job_data.title
-    job_posting.description = job_data.description
+    job_posting.sqlmodel_update(job_data.model_dump())
     
     session.add(job_posting)
+    _notify_posting(session, POSTING_UPDATED, job_posting)
     session.commit()
     session.refresh(job_posting)
+    index_posting(job_posting)
     
-    return job_posting
\ No newline at end of file
+    return job_posting
+
+@router.post("/{job_id}/close", response_model=JobPostingPublic, tags=["job_postings"])
+def close_job_posting(job_id: uuid.UUID, session: SessionDep):
+    """Stop taking applications to a job posting, its applications are archived
+    once it has been closed for APPLICATION_ARCHIVE_AFTER_DAYS"""
+    job_posting = session.get(JobPosting, job_id)
+    if not job_posting or job_posting.pending_deletion:
+        raise HTTPException(status_code=404, detail="Job posting not found")
+
+    if job_posting.closed_at is None:
+        job_posting.closed_at = datetime.now(timezone.utc)
+        session.add(job_posting)
+        _notify_posting(session, POSTING_UPDATED, job_posting)
+        session.commit()
+        session.refresh(job_posting)
+    return job_posting
+
+@router.post(
+    "/{job_id}/deletion",
+    response_model=DeletionJobPublic,
+    status_code=202,
+    tags=["job_postings"],
+)
+def delete_job_posting_in_background(
+    job_id: uuid.UUID, session: SessionDep, background_tasks: BackgroundTasks
+):
+    """Hide a job posting immediately and delete it and its applications in the background"""
+    job_posting = session.get(JobPosting, job_id)
+    if not job_posting:
+        raise HTTPException(status_code=404, detail="Job posting not found")
+
+    job = start_deletion(session=session, target=job_posting)
+    unindex_posting(job_id)
+    notify(session, POSTING_DELETED, {"id": str(job_id)})
+    session.commit()
+    background_tasks.add_task(run_deletion_job, job.id)
+    return job
+
+@router.get(
+    "/{job_id}/similar",
+    response_model=list[SimilarJobPosting],
+    tags=["job_postings"],
+)
+def read_similar_job_postings(
+    job_id: uuid.UUID,
+    session: SessionDep,
+    limit: int = Query(10, ge=1, le=100),
+):
+    """Get the job postings whose text is most similar to the given one"""
+    ensure_posting_indexes(session)
+    if job_id not in similarity_index:
+        raise HTTPException(status_code=404, detail="Job posting not found")
+
+    return [
+        SimilarJobPosting(
+            id=posting_id, title=similarity_index.title(posting_id), score=score
+        )
+        for posting_id, score in similarity_index.similar_to([job_id], limit)
+    ]
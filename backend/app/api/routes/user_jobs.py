@@ -1,12 +1,106 @@
+import json
+from collections.abc import Iterator
+from datetime import datetime
+
 from fastapi import APIRouter, HTTPException, Query
-from sqlmodel import select
-from app.models import JobPosting, UserJob, User
+from fastapi.responses import StreamingResponse
+from sqlalchemy import union_all
+from sqlmodel import Session, col, select
+from app.core.db import engine
+from app.core.outbox import (
+    APPLICATION_CREATED,
+    APPLICATION_STATUS_CHANGED,
+    record_application_event,
+)
+from app.models import ApplicationStatus, JobPosting, SimilarJobPosting, UserJob, UserJobArchive, User
 from app.api.deps import SessionDep
+from app.core.posting_indexes import ensure_posting_indexes
+from app.core.similarity import similarity_index
+from app.core.typeahead import title_index
 import uuid
 from typing import List, Dict, Any, Optional
 
 router = APIRouter(prefix="/jobs", tags=["jobs"])
 
+# Rows fetched per round trip while streaming an application history
+APPLICATION_STREAM_BATCH_SIZE = 500
+
+Since = Query(None, description="Applied at or after")
+Until = Query(None, description="Applied before")
+IncludeArchived = Query(False, description="Also include applications to postings closed long ago")
+
+
+def _applied_between(
+    since: Optional[datetime], until: Optional[datetime], model: Any = UserJob
+) -> List[Any]:
+    # Served by the BRIN index on created_at
+    filters = []
+    if since is not None:
+        filters.append(col(model.created_at) >= since)
+    if until is not None:
+        filters.append(col(model.created_at) < until)
+    return filters
+
+
+def _applications_statement(
+    user_id: uuid.UUID,
+    include_description: bool,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    include_archived: bool = False,
+    after: Optional[uuid.UUID] = None,
+    limit: Optional[int] = None,
+):
+    """Application history of a user in id order, as plain columns rather than
+    ORM objects, leaving out job descriptions unless asked for. Archived
+    applications are only read when asked for too"""
+    def applications(model: Any):
+        columns: List[Any] = [
+            model.id.label("application_id"),
+            model.status,
+            model.created_at.label("applied_at"),
+            JobPosting.id.label("job_id"),
+            JobPosting.title,
+        ]
+        if include_description:
+            columns.append(JobPosting.description)
+        statement = (
+            select(*columns)
+            .join(JobPosting, col(JobPosting.id) == model.job_posting_id)
+            .where(
+                model.user_id == user_id,
+                col(JobPosting.pending_deletion).is_(False),
+                *_applied_between(since, until, model),
+            )
+            .order_by(model.id)
+        )
+        if after is not None:
+            # Seek past the cursor through the (user_id, id) index instead of
+            # counting through an offset
+            statement = statement.where(model.id > after)
+        return statement.limit(limit)
+
+    if not include_archived:
+        return applications(UserJob)
+    # Each table is read in order through its own index, and only as far as
+    # the page needs, then the two are merged
+    merged = union_all(applications(UserJob), applications(UserJobArchive)).subquery()
+    return select(merged).order_by(merged.c.application_id).limit(limit)
+
+
+def _application_dict(row, user_id: uuid.UUID) -> Dict[str, Any]:
+    application = {
+        "application_id": str(row[0]),
+        "job_id": str(row[3]),
+        "job_title": row[4],
+        "status": row[1],
+        "applied_at": row[2].isoformat(),
+        "user_id": str(user_id),
+    }
+    if len(row) > 5:
+        application["job_description"] = row[5]
+    return application
+
 @router.get("/")
 def get_available_jobs(session: SessionDep, user_id: str = Query(..., description="User ID to check applications for")):
     """Get all available job postings with application status for specified user"""
@@ -17,8 +111,12 @@ def get_available_jobs(session: SessionDep, user_id: str = Query(..., descriptio
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
         
-        # Get all job postings
-        jobs_statement = select(JobPosting)
+        # Get all open job postings, leaving out ones linked as near-duplicates
+        jobs_statement = select(JobPosting).where(
+            col(JobPosting.pending_deletion).is_(False),
+            col(JobPosting.canonical_id).is_(None),
+            col(JobPosting.closed_at).is_(None),
+        )
         jobs = session.exec(jobs_statement).all()
         
         # Get user's applications
@@ -46,8 +144,35 @@ def get_available_jobs(session: SessionDep, user_id: str = Query(..., descriptio
         print(f"Error getting jobs with application status: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch jobs")
 
+@router.get("/recommendations", response_model=list[SimilarJobPosting])
+def get_recommended_jobs(
+    session: SessionDep,
+    user_id: uuid.UUID = Query(..., description="User ID to recommend jobs for"),
+    limit: int = Query(10, ge=1, le=100),
+):
+    """Get the jobs most similar to the ones the specified user has applied to"""
+    user = session.get(User, user_id)
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+
+    applied = session.exec(
+        select(UserJob.job_posting_id).where(UserJob.user_id == user_id)
+    ).all()
+    ensure_posting_indexes(session)
+    return [
+        SimilarJobPosting(
+            id=posting_id, title=similarity_index.title(posting_id), score=score
+        )
+        for posting_id, score in similarity_index.similar_to(applied, limit)
+    ]
+
 @router.get("/{job_id}")
-def get_job_details(job_id: str, session: SessionDep, user_id: str = Query(..., description="User ID to check application status")):
+def get_job_details(
+    job_id: str,
+    session: SessionDep,
+    user_id: str = Query(..., description="User ID to check application status"),
+    include_archived: bool = IncludeArchived,
+):
     """Get detailed information about a specific job with application status for specified user"""
     try:
         # Validate user exists
@@ -59,7 +184,7 @@ def get_job_details(job_id: str, session: SessionDep, user_id: str = Query(...,
         statement = select(JobPosting).where(JobPosting.id == job_id)
         job = session.exec(statement).first()
         
-        if not job:
+        if not job or job.pending_deletion:
             raise HTTPException(status_code=404, detail="Job not found")
         
         # Check if specified user has applied
@@ -69,13 +194,20 @@ def get_job_details(job_id: str, session: SessionDep, user_id: str = Query(...,
         )
         application = session.exec(application_statement).first()
         has_applied = application is not None
+        if not has_applied and include_archived:
+            archived_statement = select(UserJobArchive.id).where(
+                UserJobArchive.user_id == user_id,
+                UserJobArchive.job_posting_id == job_id
+            )
+            has_applied = session.exec(archived_statement).first() is not None
         
         return {
             "id": str(job.id),
             "title": job.title,
             "description": job.description,
             "has_applied": has_applied,
-            "user_id": user_id
+            "user_id": user_id,
+            "closed_at": job.closed_at.isoformat() if job.closed_at else None,
         }
         
     except HTTPException:
@@ -98,8 +230,10 @@ def apply_to_job(job_id: str, session: SessionDep, user_id: str = Query(..., des
         job_statement = select(JobPosting).where(JobPosting.id == job_id)
         job = session.exec(job_statement).first()
         
-        if not job:
+        if not job or job.pending_deletion:
             raise HTTPException(status_code=404, detail="Job not found")
+        if job.closed_at is not None:
+            raise HTTPException(status_code=400, detail="Job is closed to applications")
         
         # Check if user already applied
         existing_application = session.exec(
@@ -120,8 +254,14 @@ def apply_to_job(job_id: str, session: SessionDep, user_id: str = Query(..., des
         )
         
         session.add(new_application)
+        # Committed with the application, delivered later by the dispatcher
+        record_application_event(
+            session=session, user_job=new_application, event_type=APPLICATION_CREATED
+        )
         session.commit()
         session.refresh(new_application)
+        # Title suggestions are ranked by applicant count
+        title_index.add_applicant(new_application.job_posting_id)
         
         return {
             "message": f"Successfully applied to job: {job.title}",
@@ -139,8 +279,51 @@ def apply_to_job(job_id: str, session: SessionDep, user_id: str = Query(..., des
         print(f"Error applying to job: {e}")
         raise HTTPException(status_code=500, detail="Failed to apply to job")
 
+@router.put("/{job_id}/status")
+def update_application_status(
+    job_id: uuid.UUID,
+    session: SessionDep,
+    user_id: uuid.UUID = Query(..., description="User ID whose application changes"),
+    status: ApplicationStatus = Query(..., description="New application status"),
+):
+    """Change the status of a user's application to a job"""
+    # Locked so concurrent changes to one application are recorded in order
+    application = session.exec(
+        select(UserJob)
+        .where(UserJob.user_id == user_id, UserJob.job_posting_id == job_id)
+        .with_for_update()
+    ).first()
+    if not application:
+        raise HTTPException(status_code=404, detail="Application not found")
+
+    previous_status = application.status
+    if status != previous_status:
+        application.status = status
+        session.add(application)
+        record_application_event(
+            session=session,
+            user_job=application,
+            event_type=APPLICATION_STATUS_CHANGED,
+            previous_status=previous_status,
+        )
+    session.commit()
+    session.refresh(application)
+    return {
+        "application_id": str(application.id),
+        "job_id": str(job_id),
+        "user_id": str(user_id),
+        "status": application.status,
+        "previous_status": previous_status,
+    }
+
 @router.get("/applications/{user_id}")
-def get_user_applications(user_id: str, session: SessionDep):
+def get_user_applications(
+    user_id: str,
+    session: SessionDep,
+    since: Optional[datetime] = Since,
+    until: Optional[datetime] = Until,
+    include_archived: bool = IncludeArchived,
+):
     """Get all applications for a specific user"""
     try:
         # Validate user exists
@@ -149,33 +332,89 @@ def get_user_applications(user_id: str, session: SessionDep):
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
             
-        statement = select(UserJob, JobPosting).join(JobPosting).where(UserJob.user_id == user_id)
-        results = session.exec(statement).all()
-        
-        applications = []
-        for user_job, job_posting in results:
-            applications.append({
-                "application_id": str(user_job.id),
-                "job_id": str(job_posting.id),
-                "job_title": job_posting.title,
-                "job_description": job_posting.description,
-                "status": user_job.status,
-                "user_id": user_id
-            })
-        
-        return applications
+        # Long histories are better read through the page or stream routes
+        statement = _applications_statement(
+            user.id,
+            include_description=True,
+            since=since,
+            until=until,
+            include_archived=include_archived,
+        )
+        return [_application_dict(row, user.id) for row in session.exec(statement)]
     except HTTPException:
         raise
     except Exception as e:
         print(f"Error getting applications: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch applications")
 
+@router.get("/applications/{user_id}/page")
+def get_user_applications_page(
+    user_id: uuid.UUID,
+    session: SessionDep,
+    after: Optional[uuid.UUID] = Query(None, description="next_cursor of the previous page"),
+    limit: int = Query(50, ge=1, le=500),
+    include_description: bool = False,
+    since: Optional[datetime] = Since,
+    until: Optional[datetime] = Until,
+    include_archived: bool = IncludeArchived,
+):
+    """Get one page of a user's applications, continuing after a cursor"""
+    user = session.get(User, user_id)
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+
+    statement = _applications_statement(
+        user_id, include_description, since, until, include_archived, after, limit + 1
+    )
+    rows = session.exec(statement).all()
+    applications = [_application_dict(row, user_id) for row in rows[:limit]]
+    return {
+        "data": applications,
+        "next_cursor": applications[-1]["application_id"] if len(rows) > limit else None,
+    }
+
+@router.get("/applications/{user_id}/stream")
+def stream_user_applications(
+    user_id: uuid.UUID,
+    session: SessionDep,
+    include_description: bool = False,
+    since: Optional[datetime] = Since,
+    until: Optional[datetime] = Until,
+    include_archived: bool = IncludeArchived,
+):
+    """Stream all of a user's applications as newline delimited JSON"""
+    user = session.get(User, user_id)
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+
+    def generate() -> Iterator[str]:
+        # The request's session is closed before the response is streamed
+        with Session(engine) as stream_session:
+            statement = _applications_statement(
+                user_id, include_description, since, until, include_archived
+            ).execution_options(yield_per=APPLICATION_STREAM_BATCH_SIZE)
+            for row in stream_session.exec(statement):
+                yield json.dumps(_application_dict(row, user_id)) + "\n"
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
 @router.get("/applications")
-def get_all_applications(session: SessionDep):
+def get_all_applications(
+    session: SessionDep,
+    since: Optional[datetime] = Since,
+    until: Optional[datetime] = Until,
+    include_archived: bool = IncludeArchived,
+):
     """Get all job applications"""
     try:
-        statement = select(UserJob, JobPosting, User).join(JobPosting).join(User)
-        results = session.exec(statement).all()
+        results = []
+        for model in [UserJob, UserJobArchive] if include_archived else [UserJob]:
+            statement = select(model, JobPosting, User).join(JobPosting).join(User).where(
+                col(JobPosting.pending_deletion).is_(False),
+                col(User.pending_deletion).is_(False),
+                *_applied_between(since, until, model),
+            )
+            results.extend(session.exec(statement).all())
         
         applications = []
         for user_job, job_posting, user in results:
@@ -186,6 +425,7 @@ def get_all_applications(session: SessionDep):
                 "user_name": user.full_name,
                 "user_email": user.email,
                 "status": user_job.status,
+                "applied_at": user_job.created_at.isoformat() if user_job.created_at else None,
             })
         
         return applications
@@ -1,7 +1,11 @@
+import csv
+import io
 import uuid
+from functools import partial
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, UploadFile
+from pydantic import ValidationError
 from sqlmodel import col, delete, func, select
 
 from app import crud
@@ -11,8 +15,12 @@ from app.api.deps import (
     get_current_active_superuser,
 )
 from app.core.config import settings
+from app.core.deletion import run_deletion_job, start_deletion
+from app.core.email_queue import email_queue
 from app.core.security import get_password_hash, verify_password
 from app.models import (
+    MAX_BULK_USERS,
+    DeletionJobPublic,
     Item,
     Message,
     UpdatePassword,
@@ -20,6 +28,8 @@ from app.models import (
     UserCreate,
     UserPublic,
     UserRegister,
+    UsersBulkCreate,
+    UsersBulkCreated,
     UsersPublic,
     UserUpdate,
     UserUpdateMe,
@@ -39,10 +49,11 @@ def read_users(session: SessionDep, skip: int = 0, limit: int = 100) -> Any:
     Retrieve users.
     """
 
-    count_statement = select(func.count()).select_from(User)
+    visible = col(User.pending_deletion).is_(False)
+    count_statement = select(func.count()).select_from(User).where(visible)
     count = session.exec(count_statement).one()
 
-    statement = select(User).offset(skip).limit(limit)
+    statement = select(User).where(visible).offset(skip).limit(limit)
     users = session.exec(statement).all()
 
     return UsersPublic(data=users, count=count)
@@ -75,6 +86,73 @@ def create_user(*, session: SessionDep, user_in: UserCreate) -> Any:
     return user
 
 
+def _bulk_create_users(
+    *, session: SessionDep, users_in: list[UserCreate], send_welcome_email: bool
+) -> UsersBulkCreated:
+    created, skipped = crud.create_users(session=session, users_create=users_in)
+    if send_welcome_email and settings.emails_enabled:
+        for user_in in created:
+            email_queue.enqueue(
+                email_to=user_in.email,
+                build=partial(
+                    generate_new_account_email,
+                    email_to=user_in.email,
+                    username=user_in.email,
+                    password=user_in.password,
+                ),
+            )
+    return UsersBulkCreated(created=len(created), skipped=skipped)
+
+
+@router.post(
+    "/bulk",
+    dependencies=[Depends(get_current_active_superuser)],
+    response_model=UsersBulkCreated,
+)
+def create_users_bulk(*, session: SessionDep, body: UsersBulkCreate) -> Any:
+    """
+    Create many users at once, skipping emails that already exist.
+    """
+    return _bulk_create_users(
+        session=session,
+        users_in=body.users,
+        send_welcome_email=body.send_welcome_email,
+    )
+
+
+@router.post(
+    "/bulk/csv",
+    dependencies=[Depends(get_current_active_superuser)],
+    response_model=UsersBulkCreated,
+)
+def create_users_bulk_csv(
+    *, session: SessionDep, file: UploadFile, send_welcome_email: bool = False
+) -> Any:
+    """
+    Create many users from a CSV upload with a header row of user fields.
+    """
+    reader = csv.DictReader(io.TextIOWrapper(file.file, encoding="utf-8-sig"))
+    users_in: list[UserCreate] = []
+    errors: list[str] = []
+    for row in reader:
+        try:
+            users_in.append(
+                UserCreate.model_validate({k: v for k, v in row.items() if v})
+            )
+        except ValidationError as e:
+            errors.append(f"Line {reader.line_num}: {e.errors()[0]['msg']}")
+    if errors:
+        raise HTTPException(status_code=422, detail=errors)
+    if len(users_in) > MAX_BULK_USERS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"At most {MAX_BULK_USERS} users can be created at once",
+        )
+    return _bulk_create_users(
+        session=session, users_in=users_in, send_welcome_email=send_welcome_email
+    )
+
+
 @router.patch("/me", response_model=UserPublic)
 def update_user_me(
     *, session: SessionDep, user_in: UserUpdateMe, current_user: CurrentUser
@@ -163,6 +241,8 @@ def read_user_by_id(
     Get a specific user by id.
     """
     user = session.get(User, user_id)
+    if user and user.pending_deletion:
+        raise HTTPException(status_code=404, detail="User not found")
     if user == current_user:
         return user
     if not current_user.is_superuser:
@@ -224,3 +304,30 @@ def delete_user(
     session.delete(user)
     session.commit()
     return Message(message="User deleted successfully")
+
+
+@router.post(
+    "/{user_id}/deletion",
+    dependencies=[Depends(get_current_active_superuser)],
+    response_model=DeletionJobPublic,
+    status_code=202,
+)
+def delete_user_in_background(
+    session: SessionDep,
+    current_user: CurrentUser,
+    user_id: uuid.UUID,
+    background_tasks: BackgroundTasks,
+) -> Any:
+    """
+    Hide a user immediately and delete them and their data in the background.
+    """
+    user = session.get(User, user_id)
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+    if user == current_user:
+        raise HTTPException(
+            status_code=403, detail="Super users are not allowed to delete themselves"
+        )
+    job = start_deletion(session=session, target=user)
+    background_tasks.add_task(run_deletion_job, job.id)
+    return job
@@ -1,8 +1,10 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
 from pydantic.networks import EmailStr
 
 from app.api.deps import get_current_active_superuser
-from app.models import Message
+from app.core.compression import compression_metrics
+from app.core.health import health_probe
+from app.models import HealthStatus, Message, Metrics
 from app.utils import generate_test_email, send_email
 
 router = APIRouter(prefix="/utils", tags=["utils"])
@@ -29,3 +31,30 @@ def test_email(email_to: EmailStr) -> Message:
 @router.get("/health-check/")
 async def health_check() -> bool:
     return True
+
+
+@router.get("/health/live/")
+async def liveness() -> bool:
+    """
+    The worker is up and its event loop is serving requests.
+    """
+    return True
+
+
+@router.get("/health/ready/")
+async def readiness(response: Response) -> HealthStatus:
+    """
+    Whether the worker should receive traffic, from the cached background probe.
+    """
+    status = health_probe.status
+    if not status.ready:
+        response.status_code = 503
+    return status
+
+
+@router.get("/metrics/")
+async def metrics() -> Metrics:
+    """
+    Counters of this worker since it started.
+    """
+    return Metrics(compression=compression_metrics())
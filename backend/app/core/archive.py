@@ -0,0 +1,112 @@
+import logging
+import threading
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, insert
+from sqlmodel import Session, col, func, select
+
+from app.core.config import settings
+from app.core.db import engine
+from app.models import JobPosting, UserJob, UserJobArchive
+
+logger = logging.getLogger(__name__)
+
+# Held for each chunk so only one worker moves rows at a time
+ARCHIVE_LOCK_KEY = 0x61726368697665
+ARCHIVED_COLUMNS = (
+    "id",
+    "user_id",
+    "job_posting_id",
+    "status",
+    "created_at",
+    "updated_at",
+)
+
+
+def _archive_chunk(session: Session, cutoff: datetime, size: int) -> int:
+    """
+    Move up to `size` applications to postings closed before the cutoff, in
+    a single statement so a row is never in both tables or in neither.
+    """
+    ids = (
+        select(UserJob.id)
+        .join(JobPosting)
+        .where(col(JobPosting.closed_at) < cutoff)
+        .limit(size)
+        .scalar_subquery()
+    )
+    moved = (
+        delete(UserJob)
+        .where(col(UserJob.id).in_(ids))
+        .returning(*(getattr(UserJob, name) for name in ARCHIVED_COLUMNS))
+        .cte("moved")
+    )
+    result = session.execute(
+        insert(UserJobArchive).from_select(ARCHIVED_COLUMNS, select(moved))
+    )
+    return int(result.rowcount)
+
+
+def archive_applications(
+    cutoff: datetime | None = None, chunk_size: int | None = None
+) -> int:
+    """
+    Archive the applications of postings closed before the cutoff, which
+    defaults to APPLICATION_ARCHIVE_AFTER_DAYS ago, committing after every
+    chunk. Stops early if another worker
+    is archiving, returning how many were moved.
+    """
+    cutoff = cutoff or datetime.now(timezone.utc) - timedelta(
+        days=settings.APPLICATION_ARCHIVE_AFTER_DAYS
+    )
+    chunk_size = chunk_size or settings.APPLICATION_ARCHIVE_CHUNK_SIZE
+    archived = 0
+    with Session(engine) as session:
+        while session.exec(
+            select(func.pg_try_advisory_xact_lock(ARCHIVE_LOCK_KEY))
+        ).one():
+            moved = _archive_chunk(session, cutoff, chunk_size)
+            session.commit()
+            if not moved:
+                break
+            archived += moved
+    if archived:
+        logger.info(
+            f"Archived {archived} applications to postings closed before {cutoff}"
+        )
+    return archived
+
+
+class ApplicationArchiver:
+    """
+    Runs archive_applications periodically on a background thread.
+    """
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="application-archiver", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                archive_applications()
+            except Exception:
+                logger.exception("Archiving applications failed")
+
+
+application_archiver = ApplicationArchiver(
+    settings.APPLICATION_ARCHIVE_INTERVAL_SECONDS
+)
@@ -0,0 +1,270 @@
+import gzip
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+
+import anyio
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.models import CompressionMetrics
+
+try:
+    import brotli  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover
+    brotli = None
+
+COMPRESSIBLE_TYPES = ("application/json", "text/")
+# Bodies larger than this are compressed off the event loop
+OFFLOAD_SIZE = 64 * 1024
+
+_metrics = CompressionMetrics()
+_metrics_lock = threading.Lock()
+
+
+def compression_metrics() -> CompressionMetrics:
+    with _metrics_lock:
+        return _metrics.model_copy()
+
+
+def _record(**increments: float) -> None:
+    with _metrics_lock:
+        for name, value in increments.items():
+            setattr(_metrics, name, getattr(_metrics, name) + value)
+
+
+class CpuBudget:
+    """
+    Token bucket of compression CPU time. It refills at `cores` seconds per
+    second, up to one second's worth, so bursts are allowed but sustained
+    compression can't take more than that share of the worker.
+    """
+
+    def __init__(self, cores: float) -> None:
+        self.cores = cores
+        self._available = cores
+        self._refilled_at = time.monotonic()
+
+    def available(self) -> bool:
+        now = time.monotonic()
+        self._available = min(
+            self.cores, self._available + (now - self._refilled_at) * self.cores
+        )
+        self._refilled_at = now
+        return self._available > 0
+
+    def spend(self, seconds: float) -> None:
+        self._available -= seconds
+
+
+class CompressedCache:
+    """
+    Compressed bodies by ETag and encoding, least recently used evicted first
+    once the total size passes `max_bytes`.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self._size = 0
+        self._entries: OrderedDict[tuple[str, str], bytes] = OrderedDict()
+
+    def get(self, etag: str, encoding: str) -> bytes | None:
+        body = self._entries.get((etag, encoding))
+        if body is not None:
+            self._entries.move_to_end((etag, encoding))
+        return body
+
+    def put(self, etag: str, encoding: str, body: bytes) -> None:
+        if len(body) > self.max_bytes or (etag, encoding) in self._entries:
+            return
+        self._entries[(etag, encoding)] = body
+        self._size += len(body)
+        while self._size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= len(evicted)
+
+
+def etag_for(body: bytes) -> str:
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(etag: str, if_none_match: str) -> bool:
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def choose_encoding(accept_encoding: str) -> str | None:
+    accepted = set()
+    for part in accept_encoding.split(","):
+        name, *params = (item.strip() for item in part.split(";"))
+        quality = 1.0
+        for param in params:
+            if param.startswith("q="):
+                try:
+                    quality = float(param[2:])
+                except ValueError:
+                    quality = 0.0
+        if quality > 0:
+            accepted.add(name.lower())
+    if brotli is not None and "br" in accepted:
+        return "br"
+    if "gzip" in accepted:
+        return "gzip"
+    return None
+
+
+class CompressionMiddleware:
+    """
+    Compresses large JSON and text responses with brotli or gzip.
+
+    Small bodies aren't worth it and are sent as they are, as are all bodies
+    while the CPU budget is spent. Streamed responses pass through untouched,
+    so event streams aren't held back. Successful GET responses get an ETag
+    from a hash of their body, which answers If-None-Match with a 304 and
+    keys a cache of compressed bodies: hashing is far cheaper than
+    compressing, so an unchanged listing is only compressed once.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        minimum_size: int,
+        cpu_budget: float,
+        cache_bytes: int,
+        gzip_level: int = 6,
+        brotli_quality: int = 5,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.budget = CpuBudget(cpu_budget)
+        self.cache = CompressedCache(cache_bytes)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        request_headers = Headers(scope=scope)
+        encoding = choose_encoding(request_headers.get("accept-encoding", ""))
+        is_get = scope["method"] == "GET"
+        if encoding is None and not is_get:
+            await self.app(scope, receive, send)
+            return
+
+        start: Message | None = None
+        passthrough = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start, passthrough
+            if passthrough:
+                await send(message)
+            elif message["type"] == "http.response.start":
+                start = message
+            elif message["type"] == "http.response.body":
+                assert start is not None
+                if message.get("more_body", False) or not self._wants(start):
+                    passthrough = True
+                    await send(start)
+                    await send(message)
+                    return
+                await self._send_buffered(
+                    start,
+                    message.get("body", b""),
+                    encoding,
+                    is_get,
+                    request_headers.get("if-none-match"),
+                    send,
+                )
+            else:
+                await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+    @staticmethod
+    def _wants(start: Message) -> bool:
+        headers = Headers(raw=start["headers"])
+        content_type = headers.get("content-type", "")
+        return (
+            start["status"] == 200
+            and "content-encoding" not in headers
+            and content_type.startswith(COMPRESSIBLE_TYPES)
+        )
+
+    async def _send_buffered(
+        self,
+        start: Message,
+        body: bytes,
+        encoding: str | None,
+        is_get: bool,
+        if_none_match: str | None,
+        send: Send,
+    ) -> None:
+        headers = MutableHeaders(raw=start["headers"])
+        cacheable = is_get and "no-store" not in headers.get("cache-control", "")
+        etag = headers.get("etag")
+        if cacheable and etag is None:
+            etag = etag_for(body)
+            headers["ETag"] = etag
+        if etag is not None and if_none_match and etag_matches(etag, if_none_match):
+            _record(not_modified=1, bytes_saved=len(body))
+            del headers["content-length"]
+            await send({**start, "status": 304, "headers": headers.raw})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        if len(body) >= self.minimum_size:
+            headers.add_vary_header("Accept-Encoding")
+            if encoding is not None:
+                compressed = await self._compress(
+                    body, encoding, etag if cacheable else None
+                )
+                if compressed is not None:
+                    headers["Content-Encoding"] = encoding
+                    headers["Content-Length"] = str(len(compressed))
+                    body = compressed
+        await send({**start, "headers": headers.raw})
+        await send({"type": "http.response.body", "body": body})
+
+    async def _compress(
+        self, body: bytes, encoding: str, etag: str | None
+    ) -> bytes | None:
+        if etag is not None:
+            cached = self.cache.get(etag, encoding)
+            if cached is not None:
+                _record(
+                    cache_hits=1,
+                    bytes_in=len(body),
+                    bytes_saved=len(body) - len(cached),
+                )
+                return cached
+        if not self.budget.available():
+            _record(skipped_over_budget=1)
+            return None
+
+        compress: Callable[[], bytes]
+        if encoding == "br":
+            compress = lambda: brotli.compress(body, quality=self.brotli_quality)  # noqa: E731
+        else:
+            compress = lambda: gzip.compress(body, self.gzip_level, mtime=0)  # noqa: E731
+        compressed: bytes
+        started = time.perf_counter()
+        if len(body) > OFFLOAD_SIZE:
+            compressed = await anyio.to_thread.run_sync(compress)
+        else:
+            compressed = compress()
+        elapsed = time.perf_counter() - started
+        self.budget.spend(elapsed)
+        if etag is not None:
+            self.cache.put(etag, encoding, compressed)
+        _record(
+            responses_compressed=1,
+            cache_misses=1 if etag is not None else 0,
+            bytes_in=len(body),
+            bytes_saved=len(body) - len(compressed),
+            compression_seconds=elapsed,
+        )
+        return compressed
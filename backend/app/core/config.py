@@ -55,6 +55,8 @@ class Settings(BaseSettings):
     POSTGRES_USER: str
     POSTGRES_PASSWORD: str = ""
     POSTGRES_DB: str = ""
+    POSTGRES_POOL_SIZE: int = 5
+    POSTGRES_MAX_OVERFLOW: int = 10
 
     @computed_field  # type: ignore[prop-decorator]
     @property
@@ -90,6 +92,43 @@ class Settings(BaseSettings):
     def emails_enabled(self) -> bool:
         return bool(self.SMTP_HOST and self.EMAILS_FROM_EMAIL)
 
+    # Rows removed per transaction by background deletion jobs
+    DELETION_CHUNK_SIZE: int = 1000
+
+    # In-memory posting indexes catch up with other workers' writes this often
+    POSTING_INDEX_SYNC_SECONDS: int = 60
+    # Estimated Jaccard similarity above which a posting is a near-duplicate
+    JOB_POSTING_DUPLICATE_THRESHOLD: float = 0.8
+    JOB_POSTING_DUPLICATE_POLICY: Literal["warn", "reject", "link"] = "warn"
+
+    # Applications to postings closed longer than this are moved to the
+    # archive table, a chunk per transaction, by one archiver across workers
+    APPLICATION_ARCHIVE_AFTER_DAYS: int = 180
+    APPLICATION_ARCHIVE_CHUNK_SIZE: int = 1000
+    APPLICATION_ARCHIVE_INTERVAL_SECONDS: float = 3600.0
+
+    # Application events are delivered from the outbox to every sink configured
+    # here, by one dispatcher at a time across workers
+    OUTBOX_LOG_PATH: str | None = None
+    OUTBOX_WEBHOOK_URL: HttpUrl | None = None
+    OUTBOX_EMAIL_TO: EmailStr | None = None
+    OUTBOX_BATCH_SIZE: int = 100
+    OUTBOX_POLL_SECONDS: float = 1.0
+
+    # Responses smaller than this are sent uncompressed. Compression may use
+    # up to COMPRESSION_CPU_BUDGET cores of each worker, beyond that responses
+    # are sent uncompressed until the budget refills.
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+    COMPRESSION_CPU_BUDGET: float = 0.25
+    COMPRESSION_CACHE_BYTES: int = 64 * 1024 * 1024
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 5
+
+    # Readiness is computed by a background probe, never by the probe request
+    HEALTH_PROBE_INTERVAL_SECONDS: float = 5.0
+    HEALTH_MAX_POOL_SATURATION: float = 0.9
+    HEALTH_MAX_EMAIL_BACKLOG: int = 1000
+
     EMAIL_TEST_USER: EmailStr = "test@example.com"
     FIRST_SUPERUSER: EmailStr
     FIRST_SUPERUSER_PASSWORD: str
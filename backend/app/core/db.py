@@ -1,10 +1,16 @@
-from sqlmodel import Session, create_engine, select
-from sqlmodel import SQLModel
+from sqlalchemy import QueuePool
+from sqlalchemy.orm import configure_mappers
+from sqlmodel import Session, SQLModel, create_engine, select
+
 from app import crud
 from app.core.config import settings
 from app.models import User, UserCreate
 
-engine = create_engine(str(settings.SQLALCHEMY_DATABASE_URI))
+engine = create_engine(
+    str(settings.SQLALCHEMY_DATABASE_URI),
+    pool_size=settings.POSTGRES_POOL_SIZE,
+    max_overflow=settings.POSTGRES_MAX_OVERFLOW,
+)
 
 
 # make sure all SQLModel models are imported (app.models) before initializing DB
@@ -12,6 +18,17 @@ engine = create_engine(str(settings.SQLALCHEMY_DATABASE_URI))
 # for more details: https://github.com/fastapi/full-stack-fastapi-template/issues/28
 
 
+def warm_up() -> None:
+    """
+    Configure the ORM mappers and fill the connection pool ahead of traffic.
+    """
+    configure_mappers()
+    size = engine.pool.size() if isinstance(engine.pool, QueuePool) else 1
+    connections = [engine.connect() for _ in range(size)]
+    for connection in connections:
+        connection.close()
+
+
 def init_db(session: Session) -> None:
     # Tables should be created with Alembic migrations
     # But if you don't want to use migrations, create
@@ -19,7 +36,8 @@ def init_db(session: Session) -> None:
     # from sqlmodel import SQLModel
 
     # This works because the models are already imported and registered from app.models
-    SQLModel.metadata.create_all(engine)
+    if settings.ENVIRONMENT == "local":
+        SQLModel.metadata.create_all(engine)
 
     user = session.exec(
         select(User).where(User.email == settings.FIRST_SUPERUSER)
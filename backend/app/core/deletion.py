@@ -0,0 +1,101 @@
+import logging
+import uuid
+from typing import Any
+
+from sqlalchemy import ColumnElement
+from sqlmodel import Session, SQLModel, col, delete, select
+
+from app.core.config import settings
+from app.core.db import engine
+from app.models import DeletionJob, Item, JobPosting, User, UserJob, UserJobArchive
+
+logger = logging.getLogger(__name__)
+
+TARGET_USER = "user"
+TARGET_JOB_POSTING = "job_posting"
+
+
+def _dependents(
+    target_type: str, target_id: uuid.UUID
+) -> list[tuple[type[SQLModel], ColumnElement[bool]]]:
+    """
+    Tables to empty before the target row itself, child tables first.
+    """
+    if target_type == TARGET_USER:
+        return [
+            (Item, col(Item.owner_id) == target_id),
+            (UserJob, col(UserJob.user_id) == target_id),
+            (UserJobArchive, col(UserJobArchive.user_id) == target_id),
+            (User, col(User.id) == target_id),
+        ]
+    if target_type == TARGET_JOB_POSTING:
+        return [
+            (UserJob, col(UserJob.job_posting_id) == target_id),
+            (UserJobArchive, col(UserJobArchive.job_posting_id) == target_id),
+            (JobPosting, col(JobPosting.id) == target_id),
+        ]
+    raise ValueError(f"Unknown deletion target: {target_type}")
+
+
+def start_deletion(*, session: Session, target: User | JobPosting) -> DeletionJob:
+    """
+    Hide the target right away and record a deletion job for it.
+
+    An unfinished job for the same target is reused, so retrying resumes the
+    deletion instead of starting over.
+    """
+    target_type = TARGET_USER if isinstance(target, User) else TARGET_JOB_POSTING
+    job = session.exec(
+        select(DeletionJob).where(
+            DeletionJob.target_type == target_type,
+            DeletionJob.target_id == target.id,
+            col(DeletionJob.status).in_(["pending", "running", "failed"]),
+        )
+    ).first()
+    if job is None:
+        job = DeletionJob(target_type=target_type, target_id=target.id)
+    target.pending_deletion = True
+    session.add(target)
+    session.add(job)
+    session.commit()
+    session.refresh(job)
+    return job
+
+
+def _delete_chunk(
+    session: Session, model: type[SQLModel], where: ColumnElement[bool], size: int
+) -> int:
+    pk: Any = model.id  # type: ignore[attr-defined]
+    # DELETE has no LIMIT in Postgres, so bound it through a subquery on the key
+    ids = select(pk).where(where).limit(size).scalar_subquery()
+    result = session.exec(delete(model).where(pk.in_(ids)))  # type: ignore
+    return int(result.rowcount)
+
+
+def run_deletion_job(job_id: uuid.UUID, chunk_size: int | None = None) -> None:
+    """
+    Delete a job's target and its dependents in short, bounded transactions.
+    """
+    chunk_size = chunk_size or settings.DELETION_CHUNK_SIZE
+    with Session(engine) as session:
+        job = session.get(DeletionJob, job_id)
+        if job is None or job.status == "done":
+            return
+        job.status = "running"
+        job.error = None
+        session.add(job)
+        session.commit()
+        try:
+            for model, where in _dependents(job.target_type, job.target_id):
+                while deleted := _delete_chunk(session, model, where, chunk_size):
+                    job.deleted_rows += deleted
+                    session.add(job)
+                    session.commit()
+            job.status = "done"
+        except Exception as e:
+            session.rollback()
+            logger.exception(f"Deletion job {job_id} failed")
+            job.status = "failed"
+            job.error = str(e)[:255]
+        session.add(job)
+        session.commit()
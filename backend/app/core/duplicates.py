@@ -0,0 +1,162 @@
+import threading
+import uuid
+from array import array
+from collections.abc import Iterable
+
+from app.core.similarity import tokenize
+
+# 64 one-permutation MinHash bins, banded 8 x 8 for LSH. A pair with Jaccard
+# similarity s shares a band with probability 1 - (1 - s^8)^8: about 0.96 at
+# s = 0.8 and under 0.05 at s = 0.4.
+NUM_BINS = 64
+BANDS = 8
+ROWS = NUM_BINS // BANDS
+SHINGLE_SIZE = 3
+EMPTY = 0xFFFFFFFF
+
+
+def shingles(title: str, description: str) -> set[int]:
+    """
+    Hashes of the overlapping word 3-grams of a posting's text.
+
+    Python's string hash is salted per process, which is fine as signatures
+    are only ever compared within the worker that computed them.
+    """
+    tokens = tokenize(f"{title} {description}")
+    if len(tokens) < SHINGLE_SIZE:
+        return {hash(tuple(tokens))} if tokens else set()
+    return {
+        hash(tuple(tokens[i : i + SHINGLE_SIZE]))
+        for i in range(len(tokens) - SHINGLE_SIZE + 1)
+    }
+
+
+def signature(hashes: Iterable[int]) -> "array[int] | None":
+    """
+    One permutation MinHash: each hash lands in one bin and each bin keeps its
+    minimum, so a signature costs one pass over the shingles rather than one
+    pass per permutation. Empty bins borrow from the next filled bin to the
+    right, offset by the distance, so that sparse texts still compare fairly.
+    """
+    bins = [EMPTY] * NUM_BINS
+    for h in hashes:
+        h &= 0xFFFFFFFFFFFFFFFF
+        index, value = h % NUM_BINS, (h >> 32) & 0xFFFFFFFE
+        if value < bins[index]:
+            bins[index] = value
+    filled = [i for i, value in enumerate(bins) if value != EMPTY]
+    if not filled:
+        return None
+    densified = list(bins)
+    for i in range(NUM_BINS):
+        if bins[i] == EMPTY:
+            j = next((j for j in filled if j > i), filled[0])
+            distance = (j - i) % NUM_BINS
+            densified[i] = (bins[j] + distance) & 0xFFFFFFFF
+    return array("I", densified)
+
+
+def estimated_similarity(a: "array[int]", b: "array[int]") -> float:
+    return sum(x == y for x, y in zip(a, b, strict=True)) / NUM_BINS
+
+
+class DuplicateIndex:
+    """
+    MinHash signatures of job postings with LSH buckets to find near-duplicates.
+
+    A lookup only compares against postings sharing at least one band, so it
+    stays sub-linear in the size of the catalog.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._signatures: dict[uuid.UUID, array[int]] = {}
+        self._buckets: dict[int, list[uuid.UUID]] = {}
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def ids(self) -> set[uuid.UUID]:
+        with self._lock:
+            return set(self._signatures)
+
+    @staticmethod
+    def _band_keys(sig: "array[int]") -> list[int]:
+        return [
+            hash((band, sig[band * ROWS : (band + 1) * ROWS].tobytes()))
+            for band in range(BANDS)
+        ]
+
+    def add(self, posting_id: uuid.UUID, title: str, description: str) -> None:
+        sig = signature(shingles(title, description))
+        with self._lock:
+            self._remove(posting_id)
+            if sig is not None:
+                self._insert(self._signatures, self._buckets, posting_id, sig)
+
+    @classmethod
+    def _insert(
+        cls,
+        signatures: dict[uuid.UUID, "array[int]"],
+        buckets: dict[int, list[uuid.UUID]],
+        posting_id: uuid.UUID,
+        sig: "array[int]",
+    ) -> None:
+        signatures[posting_id] = sig
+        for key in cls._band_keys(sig):
+            buckets.setdefault(key, []).append(posting_id)
+
+    def remove(self, posting_id: uuid.UUID) -> None:
+        with self._lock:
+            self._remove(posting_id)
+
+    def _remove(self, posting_id: uuid.UUID) -> None:
+        sig = self._signatures.pop(posting_id, None)
+        if sig is None:
+            return
+        for key in self._band_keys(sig):
+            bucket = self._buckets[key]
+            bucket.remove(posting_id)
+            if not bucket:
+                del self._buckets[key]
+
+    def rebuild(self, postings: Iterable[tuple[uuid.UUID, str, str]]) -> None:
+        signatures: dict[uuid.UUID, array[int]] = {}
+        buckets: dict[int, list[uuid.UUID]] = {}
+        for posting_id, title, description in postings:
+            sig = signature(shingles(title, description))
+            if sig is not None:
+                self._insert(signatures, buckets, posting_id, sig)
+        with self._lock:
+            self._signatures, self._buckets = signatures, buckets
+
+    def find(
+        self,
+        title: str,
+        description: str,
+        threshold: float,
+        exclude: uuid.UUID | None = None,
+    ) -> tuple[uuid.UUID, float] | None:
+        """
+        The most similar indexed posting at or above the threshold, if any.
+        """
+        sig = signature(shingles(title, description))
+        if sig is None:
+            return None
+        best: tuple[uuid.UUID, float] | None = None
+        with self._lock:
+            candidates = {
+                posting_id
+                for key in self._band_keys(sig)
+                for posting_id in self._buckets.get(key, ())
+            }
+            if exclude is not None:
+                candidates.discard(exclude)
+            for posting_id in candidates:
+                score = estimated_similarity(sig, self._signatures[posting_id])
+                if score >= threshold and (best is None or score > best[1]):
+                    best = (posting_id, score)
+        return best
+
+
+duplicate_index = DuplicateIndex()
@@ -0,0 +1,68 @@
+import logging
+import queue
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from app.utils import EmailData
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class EmailTask:
+    email_to: str
+    # Rendering happens on the worker thread, not in the request
+    build: Callable[[], "EmailData"]
+
+
+class EmailQueue:
+    """
+    In-process queue of outgoing emails, drained by a single daemon thread.
+    """
+
+    def __init__(self) -> None:
+        self._queue: queue.Queue[EmailTask] = queue.Queue()
+        self._worker: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def backlog(self) -> int:
+        return self._queue.qsize()
+
+    def enqueue(self, *, email_to: str, build: Callable[[], "EmailData"]) -> None:
+        self._queue.put(EmailTask(email_to=email_to, build=build))
+        self._ensure_worker()
+
+    def join(self) -> None:
+        self._queue.join()
+
+    def _ensure_worker(self) -> None:
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._run, name="email-queue", daemon=True
+                )
+                self._worker.start()
+
+    def _run(self) -> None:
+        from app.utils import send_email
+
+        while True:
+            task = self._queue.get()
+            try:
+                email_data = task.build()
+                send_email(
+                    email_to=task.email_to,
+                    subject=email_data.subject,
+                    html_content=email_data.html_content,
+                )
+            except Exception:
+                logger.exception(f"Failed to send queued email to {task.email_to}")
+            finally:
+                self._queue.task_done()
+
+
+email_queue = EmailQueue()
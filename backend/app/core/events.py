@@ -0,0 +1,154 @@
+import asyncio
+import itertools
+import json
+import logging
+import threading
+import uuid
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlmodel import Session, func, select
+
+from app.core.db import engine
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "rolecall_events"
+# Postgres rejects notification payloads of 8000 bytes or more
+MAX_PAYLOAD_BYTES = 7900
+# Deltas a client may fall behind by before it is told to reload instead
+SUBSCRIBER_QUEUE_SIZE = 256
+
+POSTING_CREATED = "posting.created"
+POSTING_UPDATED = "posting.updated"
+POSTING_DELETED = "posting.deleted"
+# Sent to a client that fell behind, it should fetch the full list again
+RESYNC = "resync"
+
+
+def notify(session: Session, event_type: str, data: dict[str, Any]) -> None:
+    """
+    Announce a change to every worker's live streams. Postgres only delivers
+    the notification once the session's transaction commits, so a rolled
+    back change is never announced.
+    """
+    payload = json.dumps({"type": event_type, "data": data})
+    if len(payload.encode()) > MAX_PAYLOAD_BYTES and "description" in data:
+        # Clients fetch the full posting when they need it
+        data = {k: v for k, v in data.items() if k != "description"}
+        data["truncated"] = True
+        payload = json.dumps({"type": event_type, "data": data})
+    session.execute(select(func.pg_notify(CHANNEL, payload)))
+
+
+def format_sse(event_type: str, data: str) -> str:
+    return f"event: {event_type}\ndata: {data}\n\n"
+
+
+@dataclass(eq=False)
+class Subscriber:
+    user_id: uuid.UUID | None
+    queue: asyncio.Queue[str] = field(
+        default_factory=lambda: asyncio.Queue(SUBSCRIBER_QUEUE_SIZE)
+    )
+    overflowed: bool = False
+
+
+class EventBroker:
+    """
+    Fans database notifications out to the SSE streams of this worker.
+
+    One thread holds the worker's only LISTEN connection. Each event is
+    formatted once and handed to the event loop in a single callback, which
+    puts it on the queue of every interested stream.
+    """
+
+    def __init__(self) -> None:
+        self._subscribers: dict[int, Subscriber] = {}
+        self._ids = itertools.count()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        # Set while the LISTEN connection is up
+        self.listening = threading.Event()
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def subscribe(self, user_id: uuid.UUID | None) -> tuple[int, Subscriber]:
+        """
+        Register a stream, must be called from the event loop.
+        """
+        self._loop = asyncio.get_running_loop()
+        subscriber_id = next(self._ids)
+        subscriber = Subscriber(user_id=user_id)
+        self._subscribers[subscriber_id] = subscriber
+        return subscriber_id, subscriber
+
+    def unsubscribe(self, subscriber_id: int) -> None:
+        self._subscribers.pop(subscriber_id, None)
+
+    def publish(self, payload: str) -> None:
+        """
+        Deliver a notification payload, callable from any thread.
+        """
+        loop = self._loop
+        if loop is None or not self._subscribers:
+            return
+        event = json.loads(payload)
+        message = format_sse(event["type"], json.dumps(event["data"]))
+        # Application events only go to the applicant's own streams
+        user_id = event["data"].get("user_id")
+        loop.call_soon_threadsafe(self._fan_out, message, user_id)
+
+    def _fan_out(self, message: str, user_id: str | None) -> None:
+        for subscriber in list(self._subscribers.values()):
+            if user_id is not None and str(subscriber.user_id) != user_id:
+                continue
+            if subscriber.overflowed:
+                continue
+            try:
+                subscriber.queue.put_nowait(message)
+            except asyncio.QueueFull:
+                subscriber.overflowed = True
+
+    def start(self) -> None:
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="event-listener", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.listening.clear()
+
+    def _run(self) -> None:
+        import psycopg
+
+        conninfo = engine.url.set(drivername="postgresql").render_as_string(
+            hide_password=False
+        )
+        reconnecting = False
+        while not self._stop.is_set():
+            try:
+                with psycopg.connect(conninfo, autocommit=True) as connection:
+                    connection.execute(f"LISTEN {CHANNEL}")
+                    if reconnecting:
+                        # Changes made while disconnected were never heard
+                        self.publish(json.dumps({"type": RESYNC, "data": {}}))
+                    reconnecting = True
+                    self.listening.set()
+                    while not self._stop.is_set():
+                        for notification in connection.notifies(timeout=0.5):
+                            self.publish(notification.payload)
+            except Exception:
+                self.listening.clear()
+                logger.exception("Event listener lost its connection")
+                self._stop.wait(5.0)
+
+
+event_broker = EventBroker()
@@ -0,0 +1,104 @@
+import logging
+import threading
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import Engine, QueuePool, create_engine, text
+
+from app.core.config import settings
+from app.core.db import engine
+from app.core.email_queue import email_queue
+from app.models import HealthStatus
+
+logger = logging.getLogger(__name__)
+
+
+class HealthProbe:
+    """
+    Measures readiness on a background thread so probe requests only read it.
+    """
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self._status = HealthStatus(
+            ready=False,
+            database_reachable=False,
+            pool_checked_out=0,
+            pool_capacity=0,
+            pool_saturation=0.0,
+            email_backlog=0,
+        )
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        # A single dedicated connection, so a saturated pool can't starve the probe
+        self._engine: Engine | None = None
+
+    @property
+    def status(self) -> HealthStatus:
+        status = self._status
+        stale_after = timedelta(seconds=self.interval * 3)
+        if (
+            status.checked_at
+            and datetime.now(timezone.utc) - status.checked_at > stale_after
+        ):
+            return status.model_copy(update={"ready": False})
+        return status
+
+    def check(self) -> None:
+        if self._engine is None:
+            self._engine = create_engine(
+                str(settings.SQLALCHEMY_DATABASE_URI),
+                pool_size=1,
+                max_overflow=0,
+                pool_pre_ping=True,
+                connect_args={"connect_timeout": max(1, int(self.interval))},
+            )
+        try:
+            with self._engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
+            database_reachable = True
+        except Exception as e:
+            logger.warning(f"Health probe could not reach the database: {e}")
+            database_reachable = False
+
+        pool = engine.pool
+        checked_out = pool.checkedout() if isinstance(pool, QueuePool) else 0
+        capacity = settings.POSTGRES_POOL_SIZE + settings.POSTGRES_MAX_OVERFLOW
+        saturation = checked_out / capacity if capacity else 0.0
+        backlog = email_queue.backlog
+        self._status = HealthStatus(
+            ready=database_reachable
+            and saturation < settings.HEALTH_MAX_POOL_SATURATION
+            and backlog < settings.HEALTH_MAX_EMAIL_BACKLOG,
+            database_reachable=database_reachable,
+            pool_checked_out=checked_out,
+            pool_capacity=capacity,
+            pool_saturation=round(saturation, 3),
+            email_backlog=backlog,
+            checked_at=datetime.now(timezone.utc),
+        )
+
+    def start(self) -> None:
+        # Probe once up front so the worker isn't reported ready unchecked
+        self.check()
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="health-probe", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        if self._engine is not None:
+            self._engine.dispose()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.check()
+            except Exception:
+                logger.exception("Health probe failed")
+
+
+health_probe = HealthProbe(interval=settings.HEALTH_PROBE_INTERVAL_SECONDS)
@@ -0,0 +1,233 @@
+import json
+import logging
+import threading
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any, Protocol
+
+from sqlalchemy import text, update
+from sqlmodel import Session, col, func, select
+
+from app.core.config import settings
+from app.core.db import engine
+from app.core.events import notify
+from app.models import OutboxEvent, UserJob
+
+logger = logging.getLogger(__name__)
+
+APPLICATION_CREATED = "application.created"
+APPLICATION_STATUS_CHANGED = "application.status_changed"
+
+# Held for the duration of a batch so only one worker dispatches at a time,
+# which is what keeps delivery ordered per job
+DISPATCH_LOCK_KEY = 0x6F7574626F78
+MAX_BACKOFF_SECONDS = 60.0
+
+
+def record_application_event(
+    *,
+    session: Session,
+    user_job: UserJob,
+    event_type: str,
+    previous_status: str | None = None,
+) -> OutboxEvent:
+    """
+    Add an event for the application to the session, to be committed together
+    with the change it describes. Live streams hear of it on commit too.
+    """
+    payload: dict[str, Any] = {
+        "application_id": str(user_job.id),
+        "user_id": str(user_job.user_id),
+        "job_posting_id": str(user_job.job_posting_id),
+        "status": user_job.status,
+    }
+    if previous_status is not None:
+        payload["previous_status"] = previous_status
+    event = OutboxEvent(
+        event_type=event_type,
+        job_posting_id=user_job.job_posting_id,
+        payload=payload,
+    )
+    session.add(event)
+    notify(session, event_type, payload)
+    return event
+
+
+def event_dict(event: OutboxEvent) -> dict[str, Any]:
+    return {
+        "id": event.id,
+        "type": event.event_type,
+        "created_at": event.created_at.isoformat() if event.created_at else None,
+        "data": event.payload,
+    }
+
+
+class OutboxSink(Protocol):
+    name: str
+
+    def send(self, events: Sequence[OutboxEvent]) -> None:
+        """
+        Deliver a batch, raising if any of it may not have been delivered.
+        """
+
+
+class LogFileSink:
+    name = "log"
+
+    def __init__(self, path: str) -> None:
+        self.path = Path(path)
+
+    def send(self, events: Sequence[OutboxEvent]) -> None:
+        with self.path.open("a") as f:
+            for event in events:
+                f.write(json.dumps(event_dict(event)) + "\n")
+
+
+class WebhookSink:
+    name = "webhook"
+
+    def __init__(self, url: str, timeout: float = 10.0) -> None:
+        self.url = url
+        self.timeout = timeout
+
+    def send(self, events: Sequence[OutboxEvent]) -> None:
+        import httpx
+
+        response = httpx.post(
+            self.url,
+            json={"events": [event_dict(event) for event in events]},
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+
+
+class EmailSink:
+    name = "email"
+
+    def __init__(self, email_to: str) -> None:
+        self.email_to = email_to
+
+    def send(self, events: Sequence[OutboxEvent]) -> None:
+        from app.utils import generate_application_events_email, send_email
+
+        email_data = generate_application_events_email(
+            email_to=self.email_to, events=[event_dict(event) for event in events]
+        )
+        send_email(
+            email_to=self.email_to,
+            subject=email_data.subject,
+            html_content=email_data.html_content,
+        )
+
+
+def configured_sinks() -> list[OutboxSink]:
+    sinks: list[OutboxSink] = []
+    if settings.OUTBOX_LOG_PATH:
+        sinks.append(LogFileSink(settings.OUTBOX_LOG_PATH))
+    if settings.OUTBOX_WEBHOOK_URL:
+        sinks.append(WebhookSink(str(settings.OUTBOX_WEBHOOK_URL)))
+    if settings.OUTBOX_EMAIL_TO and settings.emails_enabled:
+        sinks.append(EmailSink(settings.OUTBOX_EMAIL_TO))
+    return sinks
+
+
+class OutboxDispatcher:
+    """
+    Drains the outbox in batches on a background thread.
+
+    A batch is marked dispatched only once every sink accepted it, so delivery
+    is at-least-once: after a failure the whole batch is sent again, to every
+    sink, once the backoff has passed. Failed batches are retried rather than
+    skipped, as skipping would break the per-job ordering.
+    """
+
+    def __init__(
+        self, sinks: Sequence[OutboxSink], batch_size: int, interval: float
+    ) -> None:
+        self.sinks = list(sinks)
+        self.batch_size = batch_size
+        self.interval = interval
+        self._failures = 0
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def dispatch_batch(self) -> int:
+        """
+        Deliver the oldest undelivered events, returning how many were sent.
+        """
+        with Session(engine) as session:
+            locked = session.exec(
+                select(func.pg_try_advisory_xact_lock(DISPATCH_LOCK_KEY))
+            ).one()
+            if not locked:
+                return 0
+            events = session.exec(
+                select(OutboxEvent)
+                .where(col(OutboxEvent.dispatched_at).is_(None))
+                .order_by(col(OutboxEvent.id))
+                .limit(self.batch_size)
+            ).all()
+            if not events:
+                return 0
+            ids = [event.id for event in events]
+            try:
+                for sink in self.sinks:
+                    sink.send(events)
+            except Exception as e:
+                logger.warning(f"Outbox delivery of {len(ids)} events failed: {e}")
+                session.execute(
+                    update(OutboxEvent)
+                    .where(col(OutboxEvent.id).in_(ids))
+                    .values(attempts=OutboxEvent.attempts + 1, last_error=str(e))
+                )
+                session.commit()
+                raise
+            session.execute(
+                update(OutboxEvent)
+                .where(col(OutboxEvent.id).in_(ids))
+                .values(dispatched_at=text("now()"))
+            )
+            session.commit()
+            return len(events)
+
+    def start(self) -> None:
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="outbox-dispatcher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self) -> None:
+        delay = 0.0
+        while not self._stop.wait(delay):
+            try:
+                sent = self.dispatch_batch()
+                self._failures = 0
+                # Keep draining while full batches come back
+                delay = 0.0 if sent == self.batch_size else self.interval
+            except Exception:
+                logger.exception("Outbox dispatch failed")
+                self._failures += 1
+                delay = min(self.interval * 2**self._failures, MAX_BACKOFF_SECONDS)
+
+
+def start_outbox_dispatcher() -> OutboxDispatcher | None:
+    """
+    Start dispatching if any sink is configured. Otherwise events stay in the
+    outbox until one is.
+    """
+    sinks = configured_sinks()
+    if not sinks:
+        return None
+    dispatcher = OutboxDispatcher(
+        sinks,
+        batch_size=settings.OUTBOX_BATCH_SIZE,
+        interval=settings.OUTBOX_POLL_SECONDS,
+    )
+    dispatcher.start()
+    return dispatcher
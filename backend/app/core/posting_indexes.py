@@ -0,0 +1,112 @@
+import threading
+import time
+import uuid
+
+from sqlmodel import Session, col, func, select
+
+from app.core.config import settings
+from app.core.db import engine
+from app.core.duplicates import duplicate_index
+from app.core.similarity import similarity_index
+from app.core.typeahead import title_index
+from app.models import JobPosting, UserJob
+
+# In-memory indexes over job posting text, kept per worker
+POSTING_INDEXES = (similarity_index, duplicate_index, title_index)
+
+_loaded_at: float | None = None
+_load_lock = threading.Lock()
+_sync_lock = threading.Lock()
+_visible = col(JobPosting.pending_deletion).is_(False)
+
+
+def index_posting(job_posting: JobPosting) -> None:
+    for index in POSTING_INDEXES:
+        index.add(job_posting.id, job_posting.title, job_posting.description)
+
+
+def unindex_posting(job_id: uuid.UUID) -> None:
+    for index in POSTING_INDEXES:
+        index.remove(job_id)
+
+
+def load_applicant_counts(session: Session) -> None:
+    statement = select(UserJob.job_posting_id, func.count()).group_by(
+        col(UserJob.job_posting_id)
+    )
+    title_index.set_applicants(dict(session.exec(statement).all()))
+
+
+def load_posting_indexes(session: Session) -> None:
+    global _loaded_at
+    statement = (
+        select(JobPosting.id, JobPosting.title, JobPosting.description)
+        .where(_visible)
+        .execution_options(yield_per=1000)
+    )
+    rows = session.exec(statement).all()
+    for index in POSTING_INDEXES:
+        index.rebuild(rows)
+    load_applicant_counts(session)
+    _loaded_at = time.monotonic()
+
+
+def sync_posting_indexes(session: Session) -> None:
+    """
+    Add and remove postings created or deleted through other workers.
+
+    Only the ids are compared, which is far cheaper than a full rebuild.
+    Applicant counts are re-read whole as they are a single grouped query.
+    """
+    global _loaded_at
+    ids = set(session.exec(select(JobPosting.id).where(_visible)).all())
+    for index in POSTING_INDEXES:
+        for posting_id in index.ids() - ids:
+            index.remove(posting_id)
+    new_ids = list(ids - similarity_index.ids())
+    for start in range(0, len(new_ids), 1000):
+        statement = select(JobPosting).where(
+            col(JobPosting.id).in_(new_ids[start : start + 1000])
+        )
+        for job_posting in session.exec(statement):
+            index_posting(job_posting)
+    load_applicant_counts(session)
+    _loaded_at = time.monotonic()
+
+
+def _load_in_background() -> None:
+    with _load_lock, Session(engine) as session:
+        load_posting_indexes(session)
+
+
+def _sync_in_background() -> None:
+    try:
+        with Session(engine) as session:
+            sync_posting_indexes(session)
+    finally:
+        _sync_lock.release()
+
+
+def start_loading_posting_indexes() -> None:
+    """
+    Build the indexes without delaying startup, large catalogs take a while.
+    """
+    threading.Thread(
+        target=_load_in_background, name="posting-indexes", daemon=True
+    ).start()
+
+
+def ensure_posting_indexes(session: Session) -> None:
+    """
+    Load the indexes on first use if startup didn't already, and sync them in
+    the background once older than POSTING_INDEX_SYNC_SECONDS.
+    """
+    if _loaded_at is None:
+        with _load_lock:
+            if _loaded_at is None:
+                load_posting_indexes(session)
+    elif (
+        time.monotonic() - _loaded_at > settings.POSTING_INDEX_SYNC_SECONDS
+        and _sync_lock.acquire(blocking=False)
+    ):
+        threading.Thread(target=_sync_in_background, daemon=True).start()
@@ -1,3 +1,7 @@
+import multiprocessing
+import os
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
@@ -11,6 +15,9 @@ pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 ALGORITHM = "HS256"
 
+# Below this many passwords, starting worker processes costs more than it saves
+PARALLEL_HASH_THRESHOLD = 32
+
 
 def create_access_token(subject: str | Any, expires_delta: timedelta) -> str:
     expire = datetime.now(timezone.utc) + expires_delta
@@ -25,3 +32,18 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 
 def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
+
+
+def get_password_hashes(passwords: Sequence[str]) -> list[str]:
+    """
+    Hash many passwords, spreading the bcrypt work across a process pool.
+    """
+    if len(passwords) < PARALLEL_HASH_THRESHOLD:
+        return [get_password_hash(password) for password in passwords]
+    workers = min(os.cpu_count() or 1, len(passwords))
+    chunksize = max(1, len(passwords) // (workers * 4))
+    # "spawn" avoids forking a multi-threaded server process
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        return list(executor.map(get_password_hash, passwords, chunksize=chunksize))
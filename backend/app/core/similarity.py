@@ -0,0 +1,153 @@
+import heapq
+import math
+import re
+import threading
+import uuid
+from collections import Counter, defaultdict
+from collections.abc import Iterable
+from operator import itemgetter
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#]*")
+STOP_WORDS = frozenset(
+    "a an and are as at be by for from has have in is it of on or our that the "
+    "their this to was we will with you your".split()
+)
+# Title words count this many times as much as description words
+TITLE_WEIGHT = 2
+
+
+def tokenize(text: str) -> list[str]:
+    return [
+        token
+        for token in TOKEN_PATTERN.findall(text.lower())
+        if len(token) > 1 and token not in STOP_WORDS
+    ]
+
+
+def term_vector(title: str, description: str) -> dict[str, float]:
+    """
+    Unit-length log term frequency vector of a posting's text.
+    """
+    counts = Counter(tokenize(description))
+    for token in tokenize(title):
+        counts[token] += TITLE_WEIGHT
+    weights = {term: 1 + math.log(count) for term, count in counts.items()}
+    norm = math.sqrt(sum(w * w for w in weights.values()))
+    return {term: w / norm for term, w in weights.items()} if norm else {}
+
+
+class SimilarityIndex:
+    """
+    TF-IDF cosine similarity over job postings, served from an inverted index.
+
+    Postings are stored as unit-length log-tf vectors and idf is applied at
+    query time, so adding or removing a posting never re-weights the others.
+    Queries only walk the postings lists of their highest weighted terms, and
+    terms found in most postings are skipped as they don't discriminate.
+    """
+
+    def __init__(self, max_query_terms: int = 20, max_df_ratio: float = 0.2) -> None:
+        self.max_query_terms = max_query_terms
+        self.max_df_ratio = max_df_ratio
+        self._lock = threading.RLock()
+        self._vectors: dict[uuid.UUID, dict[str, float]] = {}
+        self._titles: dict[uuid.UUID, str] = {}
+        self._postings: defaultdict[str, dict[uuid.UUID, float]] = defaultdict(dict)
+
+    def __len__(self) -> int:
+        return len(self._vectors)
+
+    def __contains__(self, posting_id: uuid.UUID) -> bool:
+        return posting_id in self._vectors
+
+    def ids(self) -> set[uuid.UUID]:
+        with self._lock:
+            return set(self._vectors)
+
+    def title(self, posting_id: uuid.UUID) -> str:
+        return self._titles.get(posting_id, "")
+
+    def add(self, posting_id: uuid.UUID, title: str, description: str) -> None:
+        vector = term_vector(title, description)
+        with self._lock:
+            self._remove(posting_id)
+            self._vectors[posting_id] = vector
+            self._titles[posting_id] = title
+            for term, weight in vector.items():
+                self._postings[term][posting_id] = weight
+
+    def remove(self, posting_id: uuid.UUID) -> None:
+        with self._lock:
+            self._remove(posting_id)
+
+    def _remove(self, posting_id: uuid.UUID) -> None:
+        vector = self._vectors.pop(posting_id, None)
+        self._titles.pop(posting_id, None)
+        for term in vector or ():
+            postings = self._postings[term]
+            postings.pop(posting_id, None)
+            if not postings:
+                del self._postings[term]
+
+    def rebuild(self, postings: Iterable[tuple[uuid.UUID, str, str]]) -> None:
+        """
+        Replace the whole index, building the new one before taking the lock.
+        """
+        vectors: dict[uuid.UUID, dict[str, float]] = {}
+        titles: dict[uuid.UUID, str] = {}
+        inverted: defaultdict[str, dict[uuid.UUID, float]] = defaultdict(dict)
+        for posting_id, title, description in postings:
+            vector = term_vector(title, description)
+            vectors[posting_id] = vector
+            titles[posting_id] = title
+            for term, weight in vector.items():
+                inverted[term][posting_id] = weight
+        with self._lock:
+            self._vectors, self._titles, self._postings = vectors, titles, inverted
+
+    def similar_to(
+        self, posting_ids: Iterable[uuid.UUID], k: int
+    ) -> list[tuple[uuid.UUID, float]]:
+        """
+        Top-k postings most similar to the given ones, which are left out.
+        """
+        with self._lock:
+            exclude = {pid for pid in posting_ids if pid in self._vectors}
+            query: defaultdict[str, float] = defaultdict(float)
+            for posting_id in exclude:
+                for term, weight in self._vectors[posting_id].items():
+                    query[term] += weight
+            return self._top_k(query, k, exclude)
+
+    def _top_k(
+        self, query: dict[str, float], k: int, exclude: set[uuid.UUID]
+    ) -> list[tuple[uuid.UUID, float]]:
+        total = len(self._vectors)
+        max_df = max(self.max_df_ratio * total, 1)
+        weights: dict[str, float] = {}
+        for term, weight in query.items():
+            df = len(self._postings.get(term, ()))
+            if df and (total < 100 or df <= max_df):
+                idf = math.log((1 + total) / (1 + df)) + 1
+                weights[term] = weight * idf * idf
+        norm = math.sqrt(sum(w * w for w in weights.values()))
+        if not norm:
+            return []
+
+        scores: defaultdict[uuid.UUID, float] = defaultdict(float)
+        for term, weight in heapq.nlargest(
+            self.max_query_terms, weights.items(), key=itemgetter(1)
+        ):
+            for posting_id, posting_weight in self._postings[term].items():
+                scores[posting_id] += weight * posting_weight
+        for posting_id in exclude:
+            scores.pop(posting_id, None)
+        return [
+            (posting_id, score / norm)
+            for posting_id, score in heapq.nlargest(
+                k, scores.items(), key=itemgetter(1)
+            )
+        ]
+
+
+similarity_index = SimilarityIndex()
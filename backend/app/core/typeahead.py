@@ -0,0 +1,135 @@
+import heapq
+import re
+import threading
+import time
+import uuid
+from bisect import bisect_left, insort
+from collections import Counter
+from collections.abc import Iterable, Mapping
+
+WORD_START = re.compile(r"(?<![a-z0-9])[a-z0-9]")
+# Prefixes matching more entries than this get their results cached
+CACHE_MIN_MATCHES = 64
+# Applications don't invalidate cached results, they age out instead
+CACHE_TTL_SECONDS = 5.0
+
+
+def normalize(text: str) -> str:
+    return " ".join(text.lower().split())
+
+
+def title_keys(title: str) -> list[str]:
+    """
+    The title from each word onwards, so that "eng" also completes
+    "Senior engineer".
+    """
+    normalized = normalize(title)
+    return [normalized[m.start() :] for m in WORD_START.finditer(normalized)]
+
+
+class TitleIndex:
+    """
+    Prefix index over job posting titles for autocomplete.
+
+    Keys live in one sorted list, so a lookup is two bisections plus a walk
+    over the matching range. Postings sharing a title are suggested once,
+    ranked by their combined applicant count. Short prefixes match much of
+    the catalog, so their results are cached until a title changes or the
+    ranking is a few seconds old.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._keys: list[tuple[str, uuid.UUID]] = []
+        # Posting id to its title and normalized title
+        self._titles: dict[uuid.UUID, tuple[str, str]] = {}
+        self._applicants: dict[uuid.UUID, int] = {}
+        self._cache: dict[str, tuple[float, list[tuple[str, int]]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._titles)
+
+    def ids(self) -> set[uuid.UUID]:
+        with self._lock:
+            return set(self._titles)
+
+    def add(self, posting_id: uuid.UUID, title: str, description: str) -> None:
+        with self._lock:
+            if posting_id in self._titles and self._titles[posting_id][0] == title:
+                return
+            self._remove(posting_id)
+            self._titles[posting_id] = (title, normalize(title))
+            for key in title_keys(title):
+                insort(self._keys, (key, posting_id))
+            self._cache.clear()
+
+    def remove(self, posting_id: uuid.UUID) -> None:
+        with self._lock:
+            self._remove(posting_id)
+            self._applicants.pop(posting_id, None)
+            self._cache.clear()
+
+    def _remove(self, posting_id: uuid.UUID) -> None:
+        titles = self._titles.pop(posting_id, None)
+        if titles is None:
+            return
+        for key in title_keys(titles[1]):
+            i = bisect_left(self._keys, (key, posting_id))
+            del self._keys[i]
+
+    def rebuild(self, postings: Iterable[tuple[uuid.UUID, str, str]]) -> None:
+        titles = {
+            posting_id: (title, normalize(title)) for posting_id, title, _ in postings
+        }
+        keys = sorted(
+            (key, posting_id)
+            for posting_id, (_, normalized) in titles.items()
+            for key in title_keys(normalized)
+        )
+        with self._lock:
+            self._keys, self._titles = keys, titles
+            self._cache.clear()
+
+    def set_applicants(self, counts: Mapping[uuid.UUID, int]) -> None:
+        with self._lock:
+            self._applicants = dict(counts)
+            self._cache.clear()
+
+    def add_applicant(self, posting_id: uuid.UUID) -> None:
+        with self._lock:
+            self._applicants[posting_id] = self._applicants.get(posting_id, 0) + 1
+
+    def complete(self, prefix: str, limit: int) -> list[tuple[str, int]]:
+        """
+        Up to `limit` (title, applicant count) pairs with a word starting with
+        the prefix, most applied to first.
+        """
+        prefix = normalize(prefix)
+        if not prefix:
+            return []
+        now = time.monotonic()
+        with self._lock:
+            cached_at, cached = self._cache.get(prefix, (0.0, []))
+            if now - cached_at < CACHE_TTL_SECONDS and len(cached) >= limit:
+                return cached[:limit]
+            start = bisect_left(self._keys, (prefix,))
+            end = bisect_left(self._keys, (prefix + "\uffff",), lo=start)
+            # Group postings by title, case and spacing aside
+            spellings: dict[str, str] = {}
+            counts: Counter[str] = Counter()
+            for posting_id in {posting_id for _, posting_id in self._keys[start:end]}:
+                title, normalized = self._titles[posting_id]
+                spellings[normalized] = min(title, spellings.get(normalized, title))
+                counts[normalized] += self._applicants.get(posting_id, 0)
+            results = [
+                (spellings[normalized], count)
+                for normalized, count in heapq.nsmallest(
+                    limit, counts.items(), key=lambda item: (-item[1], item[0])
+                )
+            ]
+            if end - start >= CACHE_MIN_MATCHES:
+                self._cache[prefix] = (now, results)
+            return results
+
+
+title_index = TitleIndex()
@@ -1,9 +1,11 @@
 import uuid
+from collections.abc import Sequence
 from typing import Any
 
-from sqlmodel import Session, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import Session, col, select
 
-from app.core.security import get_password_hash, verify_password
+from app.core.security import get_password_hash, get_password_hashes, verify_password
 from app.models import Item, ItemCreate, User, UserCreate, UserUpdate
 
 
@@ -17,6 +19,57 @@ def create_user(*, session: Session, user_create: UserCreate) -> User:
     return db_obj
 
 
+def create_users(
+    *, session: Session, users_create: Sequence[UserCreate], batch_size: int = 1000
+) -> tuple[list[UserCreate], list[str]]:
+    """
+    Create many users at once, skipping emails that already exist.
+
+    Returns the inputs that were created and the emails that were skipped.
+    """
+    unique: dict[str, UserCreate] = {}
+    skipped: list[str] = []
+    for user_create in users_create:
+        if user_create.email in unique:
+            skipped.append(user_create.email)
+        else:
+            unique[user_create.email] = user_create
+    if not unique:
+        return [], skipped
+
+    existing = set(
+        session.exec(select(User.email).where(col(User.email).in_(unique))).all()
+    )
+    skipped.extend(email for email in unique if email in existing)
+    pending = [user for email, user in unique.items() if email not in existing]
+    hashed_passwords = get_password_hashes([user.password for user in pending])
+
+    inserted: set[str] = set()
+    for start in range(0, len(pending), batch_size):
+        rows = [
+            User.model_validate(
+                user_create, update={"hashed_password": hashed_password}
+            ).model_dump()
+            for user_create, hashed_password in zip(
+                pending[start : start + batch_size],
+                hashed_passwords[start : start + batch_size],
+                strict=True,
+            )
+        ]
+        # Emails registered concurrently since the lookup are skipped, not fatal
+        statement = (
+            insert(User)
+            .on_conflict_do_nothing(index_elements=["email"])
+            .returning(col(User.email))
+        )
+        inserted.update(session.scalars(statement, rows).all())
+        session.commit()
+
+    created = [user for user in pending if user.email in inserted]
+    skipped.extend(user.email for user in pending if user.email not in inserted)
+    return created, skipped
+
+
 def update_user(*, session: Session, db_user: User, user_in: UserUpdate) -> Any:
     user_data = user_in.model_dump(exclude_unset=True)
     extra_data = {}
@@ -39,7 +92,7 @@ def get_user_by_email(*, session: Session, email: str) -> User | None:
 
 def authenticate(*, session: Session, email: str, password: str) -> User | None:
     db_user = get_user_by_email(session=session, email=email)
-    if not db_user:
+    if not db_user or db_user.pending_deletion:
         return None
     if not verify_password(password, db_user.hashed_password):
         return None
@@ -1,8 +0,0 @@
-from sqlmodel import Session, SQLModel, create_engine
-
-DATABASE_URL = "sqlite:///./app.db"  # Or your actual database URL
-engine = create_engine(DATABASE_URL, echo=True)
-
-def get_session():
-    with Session(engine) as session:
-        yield session
\ No newline at end of file
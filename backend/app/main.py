@@ -1,10 +1,20 @@
-import sentry_sdk
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.routing import APIRoute
+from sqlmodel import SQLModel
 from starlette.middleware.cors import CORSMiddleware
+
 from app.api.main import api_router
-from sqlmodel import SQLModel 
+from app.core.archive import application_archiver
+from app.core.compression import CompressionMiddleware
 from app.core.config import settings
+from app.core.db import engine, warm_up
+from app.core.events import event_broker
+from app.core.health import health_probe
+from app.core.outbox import start_outbox_dispatcher
+from app.core.posting_indexes import start_loading_posting_indexes
 
 
 def custom_generate_unique_id(route: APIRoute) -> str:
@@ -12,22 +22,38 @@ def custom_generate_unique_id(route: APIRoute) -> str:
 
 
 if settings.SENTRY_DSN and settings.ENVIRONMENT != "local":
+    import sentry_sdk
+
     sentry_sdk.init(dsn=str(settings.SENTRY_DSN), enable_tracing=True)
 
-def create_db_and_tables():
-    from app.db import engine
-    SQLModel.metadata.create_all(engine)
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    # Deployed environments rely only on the Alembic migrations run by prestart
+    if settings.ENVIRONMENT == "local":
+        SQLModel.metadata.create_all(engine)
+    # Finish the slow first-use work before the worker accepts traffic
+    warm_up()
+    start_loading_posting_indexes()
+    health_probe.start()
+    outbox_dispatcher = start_outbox_dispatcher()
+    event_broker.start()
+    application_archiver.start()
+    yield
+    application_archiver.stop()
+    event_broker.stop()
+    if outbox_dispatcher is not None:
+        outbox_dispatcher.stop()
+    health_probe.stop()
+
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
     generate_unique_id_function=custom_generate_unique_id,
+    lifespan=lifespan,
 )
 
-@app.on_event("startup") 
-def on_startup():
-    create_db_and_tables()
-
 # Set all CORS enabled origins
 if settings.all_cors_origins:
     app.add_middleware(
@@ -38,5 +64,13 @@ if settings.all_cors_origins:
         allow_headers=["*"],
     )
 
-app.include_router(api_router, prefix=settings.API_V1_STR)
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+    cpu_budget=settings.COMPRESSION_CPU_BUDGET,
+    cache_bytes=settings.COMPRESSION_CACHE_BYTES,
+    gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+    brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+)
 
+app.include_router(api_router, prefix=settings.API_V1_STR)
@@ -1,7 +1,10 @@
 import uuid
+from datetime import datetime, timezone
+from typing import Any, Literal
 
-from pydantic import EmailStr
-from sqlmodel import Field, Relationship, SQLModel
+from pydantic import EmailStr, model_validator
+from sqlalchemy import JSON, BigInteger, DateTime, Index, func, text
+from sqlmodel import AutoString, Field, Relationship, SQLModel
 
 
 # Shared properties
@@ -47,6 +50,8 @@ class UpdatePassword(SQLModel):
 class User(UserBase, table=True):
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     hashed_password: str
+    # Set while a background deletion job removes the user's data
+    pending_deletion: bool = False
     items: list["Item"] = Relationship(back_populates="owner", cascade_delete=True)
 
 
@@ -60,6 +65,21 @@ class UsersPublic(SQLModel):
     count: int
 
 
+# Largest batch accepted by the bulk user endpoints
+MAX_BULK_USERS = 10_000
+MAX_BULK_JOB_POSTINGS = 1000
+
+
+class UsersBulkCreate(SQLModel):
+    users: list[UserCreate] = Field(max_length=MAX_BULK_USERS)
+    send_welcome_email: bool = False
+
+
+class UsersBulkCreated(SQLModel):
+    created: int
+    skipped: list[str]
+
+
 # Shared properties
 class ItemBase(SQLModel):
     title: str = Field(min_length=1, max_length=255)
@@ -80,7 +100,7 @@ class ItemUpdate(ItemBase):
 class Item(ItemBase, table=True):
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     owner_id: uuid.UUID = Field(
-        foreign_key="user.id", nullable=False, ondelete="CASCADE"
+        foreign_key="user.id", nullable=False, ondelete="CASCADE", index=True
     )
     owner: User | None = Relationship(back_populates="items")
 
@@ -101,6 +121,32 @@ class Message(SQLModel):
     message: str
 
 
+# Readiness as last measured by the background health probe
+class HealthStatus(SQLModel):
+    ready: bool
+    database_reachable: bool
+    pool_checked_out: int
+    pool_capacity: int
+    pool_saturation: float
+    email_backlog: int
+    checked_at: datetime | None = None
+
+
+class CompressionMetrics(SQLModel):
+    responses_compressed: int = 0
+    bytes_in: int = 0
+    bytes_saved: int = 0
+    compression_seconds: float = 0.0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    not_modified: int = 0
+    skipped_over_budget: int = 0
+
+
+class Metrics(SQLModel):
+    compression: CompressionMetrics
+
+
 # JSON payload containing access token
 class Token(SQLModel):
     access_token: str
@@ -116,13 +162,251 @@ class NewPassword(SQLModel):
     token: str
     new_password: str = Field(min_length=8, max_length=40)
 
-class JobPosting(SQLModel, table=True):
-    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
+
+def created_at_field() -> Any:
+    """
+    Creation time, set by the database when the row is inserted.
+    """
+    return Field(
+        default=None,
+        sa_type=DateTime(timezone=True),  # type: ignore
+        sa_column_kwargs={"server_default": func.now()},
+        nullable=False,
+    )
+
+
+def updated_at_field() -> Any:
+    """
+    Last modification time, set by the database on insert and every update.
+    """
+    return Field(
+        default=None,
+        sa_type=DateTime(timezone=True),  # type: ignore
+        sa_column_kwargs={"server_default": func.now(), "onupdate": func.now()},
+        nullable=False,
+    )
+
+
+EmploymentType = Literal[
+    "full_time", "part_time", "contract", "internship", "temporary"
+]
+
+
+# Shared properties
+class JobPostingBase(SQLModel):
     title: str
     description: str
-    
+    location: str | None = Field(default=None, max_length=255)
+    employment_type: EmploymentType | None = Field(
+        default=None,
+        sa_type=AutoString(length=20),  # type: ignore
+    )
+    # Yearly salary range, either end may be left open
+    salary_min: int | None = Field(default=None, ge=0)
+    salary_max: int | None = Field(default=None, ge=0)
+
+    @model_validator(mode="after")
+    def check_salary_range(self) -> "JobPostingBase":
+        if (
+            self.salary_min is not None
+            and self.salary_max is not None
+            and self.salary_min > self.salary_max
+        ):
+            raise ValueError("salary_min must not be greater than salary_max")
+        return self
+
+
+# Properties to receive on job posting creation
+class JobPostingCreate(JobPostingBase):
+    pass
+
+
+# Properties to receive on job posting update
+class JobPostingUpdate(JobPostingBase):
+    pass
+
+
+# Database model, database table inferred from class name
+class JobPosting(JobPostingBase, table=True):
+    # Filtered listings narrow by one of these and page newest first
+    __table_args__ = (
+        Index(
+            "ix_jobposting_employment_type_posted_at", "employment_type", "posted_at"
+        ),
+        Index("ix_jobposting_location_posted_at", "location", "posted_at"),
+        Index("ix_jobposting_salary_min_salary_max", "salary_min", "salary_max"),
+        # Rows are appended in creation order, so a BRIN index stays tiny and
+        # lets time-bounded scans skip all but the matching block ranges
+        Index("ix_jobposting_created_at", "created_at", postgresql_using="brin"),
+    )
+
+    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    posted_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_type=DateTime(timezone=True),  # type: ignore
+        index=True,
+    )
+    # Set when the posting was linked to the one it near-duplicates
+    canonical_id: uuid.UUID | None = Field(
+        default=None, foreign_key="jobposting.id", ondelete="SET NULL", index=True
+    )
+    # Set while a background deletion job removes the posting's applications
+    pending_deletion: bool = False
+    # Closed postings take no new applications, and their applications are
+    # archived once the posting has been closed long enough
+    closed_at: datetime | None = Field(
+        default=None,
+        sa_type=DateTime(timezone=True),  # type: ignore
+        index=True,
+    )
+    created_at: datetime | None = created_at_field()
+    updated_at: datetime | None = updated_at_field()
+
+
+# Properties to return via API, id is always required
+class JobPostingPublic(JobPostingBase):
+    id: uuid.UUID
+    posted_at: datetime
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
+    canonical_id: uuid.UUID | None = None
+    closed_at: datetime | None = None
+
+
+class FacetCount(SQLModel):
+    value: str | None
+    count: int
+
+
+class JobPostingFacets(SQLModel):
+    location: list[FacetCount]
+    employment_type: list[FacetCount]
+
+
+class JobPostingsSearchResults(SQLModel):
+    data: list[JobPostingPublic]
+    # Matching postings in all, and broken down by attribute
+    count: int
+    facets: JobPostingFacets
+
+
+class JobPostingsBulkCreate(SQLModel):
+    job_postings: list[JobPostingCreate] = Field(max_length=MAX_BULK_JOB_POSTINGS)
+
+
+class JobTitleSuggestion(SQLModel):
+    title: str
+    applicants: int
+
+
+class JobPostingDuplicate(SQLModel):
+    # Position of the posting in the submitted list
+    index: int
+    duplicate_of: uuid.UUID
+    similarity: float
+
+
+class JobPostingsBulkCreated(SQLModel):
+    data: list[JobPostingPublic]
+    duplicates: list[JobPostingDuplicate]
+
+
+class SimilarJobPosting(SQLModel):
+    id: uuid.UUID
+    title: str
+    score: float
+
+
 class UserJob(SQLModel, table=True):
+    # A user's applications are paged through by id, this also serves
+    # lookups by user_id alone
+    __table_args__ = (
+        Index("ix_userjob_user_id_id", "user_id", "id"),
+        Index("ix_userjob_created_at", "created_at", postgresql_using="brin"),
+    )
+
+    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    user_id: uuid.UUID = Field(
+        foreign_key="user.id", nullable=False, ondelete="CASCADE"
+    )
+    job_posting_id: uuid.UUID = Field(
+        foreign_key="jobposting.id", nullable=False, ondelete="CASCADE", index=True
+    )
+    status: str = Field(default="applied")
+    created_at: datetime | None = created_at_field()
+    updated_at: datetime | None = updated_at_field()
+
+
+# Applications to postings closed for longer than
+# APPLICATION_ARCHIVE_AFTER_DAYS, moved out of UserJob so that the queries on
+# current applications only ever touch the hot set
+class UserJobArchive(SQLModel, table=True):
+    __table_args__ = (Index("ix_userjobarchive_user_id_id", "user_id", "id"),)
+
+    id: uuid.UUID = Field(primary_key=True)
+    user_id: uuid.UUID = Field(
+        foreign_key="user.id", nullable=False, ondelete="CASCADE"
+    )
+    job_posting_id: uuid.UUID = Field(
+        foreign_key="jobposting.id", nullable=False, ondelete="CASCADE", index=True
+    )
+    status: str
+    created_at: datetime | None = Field(
+        default=None,
+        sa_type=DateTime(timezone=True),  # type: ignore
+        nullable=False,
+    )
+    updated_at: datetime | None = Field(
+        default=None,
+        sa_type=DateTime(timezone=True),  # type: ignore
+        nullable=False,
+    )
+    archived_at: datetime | None = created_at_field()
+
+
+ApplicationStatus = Literal[
+    "applied", "reviewing", "interviewing", "offered", "rejected", "withdrawn"
+]
+
+
+# Application events, written in the same transaction as the change they
+# describe and delivered to the configured sinks by a background dispatcher
+class OutboxEvent(SQLModel, table=True):
+    # Lets the dispatcher find undelivered events without scanning old ones
+    __table_args__ = (
+        Index(
+            "ix_outboxevent_undelivered",
+            "id",
+            postgresql_where=text("dispatched_at IS NULL"),
+        ),
+    )
+
+    # Events are delivered in id order, which keeps them ordered per job
+    id: int | None = Field(default=None, primary_key=True, sa_type=BigInteger)
+    event_type: str = Field(max_length=64)
+    job_posting_id: uuid.UUID
+    payload: dict[str, Any] = Field(default_factory=dict, sa_type=JSON)
+    created_at: datetime | None = created_at_field()
+    dispatched_at: datetime | None = Field(
+        default=None,
+        sa_type=DateTime(timezone=True),  # type: ignore
+    )
+    attempts: int = 0
+    last_error: str | None = None
+
+
+# Background deletion of a user or job posting and everything that depends on it
+class DeletionJobBase(SQLModel):
+    target_type: str = Field(max_length=32)
+    target_id: uuid.UUID
+    status: str = Field(default="pending", max_length=32)
+    deleted_rows: int = 0
+    error: str | None = Field(default=None, max_length=255)
+
+
+class DeletionJob(DeletionJobBase, table=True):
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
-    user_id: uuid.UUID = Field(foreign_key="user.id", nullable=False)
-    job_posting_id: uuid.UUID = Field(foreign_key="jobposting.id", nullable=False)  # This should work now
-    status: str = Field(default="applied")
\ No newline at end of file
+
+
+class DeletionJobPublic(DeletionJobBase):
+    id: uuid.UUID
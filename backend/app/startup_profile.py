@@ -0,0 +1,70 @@
+import logging
+import re
+import subprocess
+import sys
+import time
+from collections.abc import Callable
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# "import time:      self [us] | cumulative | imported package"
+IMPORT_TIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def parse_import_times(output: str) -> list[tuple[str, float, float]]:
+    """
+    Parse `python -X importtime` output into (module, self ms, cumulative ms).
+    """
+    times = []
+    for line in output.splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, _, module = match.groups()
+            times.append((module, int(self_us) / 1000, int(cumulative_us) / 1000))
+    return times
+
+
+def profile_imports(top: int = 25) -> None:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app.main"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = parse_import_times(result.stderr)
+    logger.info(f"{'cumulative ms':>14} {'self ms':>9}  module")
+    for module, self_ms, cumulative_ms in sorted(
+        times, key=lambda t: t[2], reverse=True
+    )[:top]:
+        logger.info(f"{cumulative_ms:14.1f} {self_ms:9.1f}  {module}")
+
+
+def _timed(name: str, step: Callable[[], object]) -> None:
+    start = time.perf_counter()
+    step()
+    logger.info(f"{(time.perf_counter() - start) * 1000:10.1f} ms  {name}")
+
+
+def profile_startup() -> None:
+    def import_app() -> None:
+        import app.main  # noqa: F401
+
+    def warm_up() -> None:
+        from app.core.db import warm_up
+
+        warm_up()
+
+    _timed("import app.main", import_app)
+    _timed("warm up (mappers and connection pool)", warm_up)
+
+
+def main() -> None:
+    logger.info("Import time per module (slowest first)")
+    profile_imports()
+    logger.info("Initialization steps")
+    profile_startup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,290 @@
+import uuid
+
+from fastapi.testclient import TestClient
+from sqlmodel import Session, select
+
+from app.core.config import settings
+from app.models import JobPosting, UserJob
+from app.tests.utils.user import create_random_user
+from app.tests.utils.utils import random_lower_string
+
+
+def test_delete_job_posting_in_background(client: TestClient, db: Session) -> None:
+    job_posting = JobPosting(title="Engineer", description="Build things")
+    db.add(job_posting)
+    for _ in range(3):
+        user = create_random_user(db)
+        db.add(UserJob(user_id=user.id, job_posting_id=job_posting.id))
+    db.commit()
+    job_posting_id = job_posting.id
+
+    r = client.post(f"{settings.API_V1_STR}/job_postings/{job_posting_id}/deletion")
+    assert r.status_code == 202
+    job = r.json()
+    assert job["target_type"] == "job_posting"
+    assert job["status"] == "pending"
+
+    r = client.get(f"{settings.API_V1_STR}/job_postings/")
+    assert str(job_posting_id) not in [p["id"] for p in r.json()]
+    db.expire_all()
+    assert db.get(JobPosting, job_posting_id) is None
+    assert (
+        db.exec(select(UserJob).where(UserJob.job_posting_id == job_posting_id)).first()
+        is None
+    )
+
+
+def test_read_similar_job_postings(client: TestClient) -> None:
+    team, product, skill = (random_lower_string() for _ in range(3))
+    postings = [
+        {"title": f"{product} engineer", "description": f"{skill} for {team}"},
+        {"title": f"{team} developer", "description": f"{product} and {skill}"},
+        {"title": random_lower_string(), "description": random_lower_string()},
+    ]
+    ids = [
+        client.post(f"{settings.API_V1_STR}/job_postings/", json=p).json()["id"]
+        for p in postings
+    ]
+
+    r = client.get(f"{settings.API_V1_STR}/job_postings/{ids[0]}/similar")
+    assert r.status_code == 200
+    content = r.json()
+    assert content[0]["id"] == ids[1]
+    assert content[0]["title"] == postings[1]["title"]
+    assert ids[2] not in [p["id"] for p in content]
+
+
+def test_read_similar_job_postings_not_found(client: TestClient) -> None:
+    r = client.get(f"{settings.API_V1_STR}/job_postings/{uuid.uuid4()}/similar")
+    assert r.status_code == 404
+
+
+def random_job_posting() -> dict[str, str]:
+    return {
+        "title": f"{random_lower_string()} engineer",
+        "description": " ".join(random_lower_string() for _ in range(40)),
+    }
+
+
+def near_duplicate(job_posting: dict[str, str]) -> dict[str, str]:
+    return {**job_posting, "description": f"{job_posting['description']} remote"}
+
+
+def test_create_duplicate_job_posting_warns(client: TestClient) -> None:
+    original = random_job_posting()
+    r = client.post(f"{settings.API_V1_STR}/job_postings/", json=original)
+    assert r.status_code == 200
+    assert "X-Duplicate-Of" not in r.headers
+    original_id = r.json()["id"]
+
+    r = client.post(
+        f"{settings.API_V1_STR}/job_postings/",
+        json=near_duplicate(original),
+        params={"on_duplicate": "warn"},
+    )
+    assert r.status_code == 200
+    assert r.headers["X-Duplicate-Of"] == original_id
+    assert r.json()["canonical_id"] is None
+
+
+def test_create_duplicate_job_posting_rejected(client: TestClient) -> None:
+    original = random_job_posting()
+    original_id = client.post(
+        f"{settings.API_V1_STR}/job_postings/", json=original
+    ).json()["id"]
+
+    r = client.post(
+        f"{settings.API_V1_STR}/job_postings/",
+        json=near_duplicate(original),
+        params={"on_duplicate": "reject"},
+    )
+    assert r.status_code == 409
+    assert original_id in r.json()["detail"]
+
+
+def test_create_duplicate_job_posting_linked(client: TestClient) -> None:
+    original = random_job_posting()
+    original_id = client.post(
+        f"{settings.API_V1_STR}/job_postings/", json=original
+    ).json()["id"]
+
+    r = client.post(
+        f"{settings.API_V1_STR}/job_postings/",
+        json=near_duplicate(original),
+        params={"on_duplicate": "link"},
+    )
+    assert r.status_code == 200
+    duplicate = r.json()
+    assert duplicate["canonical_id"] == original_id
+
+    r = client.get(f"{settings.API_V1_STR}/job_postings/")
+    assert duplicate["id"] not in [p["id"] for p in r.json()]
+    r = client.get(
+        f"{settings.API_V1_STR}/job_postings/", params={"include_duplicates": True}
+    )
+    assert duplicate["id"] in [p["id"] for p in r.json()]
+
+    # Rewriting the posting makes it an original again
+    r = client.put(
+        f"{settings.API_V1_STR}/job_postings/{duplicate['id']}",
+        json=random_job_posting(),
+        params={"on_duplicate": "link"},
+    )
+    assert r.status_code == 200
+    assert r.json()["canonical_id"] is None
+
+
+def test_create_job_postings_bulk(client: TestClient) -> None:
+    existing = random_job_posting()
+    existing_id = client.post(
+        f"{settings.API_V1_STR}/job_postings/", json=existing
+    ).json()["id"]
+    new = random_job_posting()
+    job_postings = [new, near_duplicate(existing), near_duplicate(new)]
+
+    r = client.post(
+        f"{settings.API_V1_STR}/job_postings/bulk",
+        json={"job_postings": job_postings},
+        params={"on_duplicate": "reject"},
+    )
+    assert r.status_code == 200
+    content = r.json()
+    assert [p["title"] for p in content["data"]] == [new["title"]]
+    new_id = content["data"][0]["id"]
+    assert [(d["index"], d["duplicate_of"]) for d in content["duplicates"]] == [
+        (1, existing_id),
+        (2, new_id),
+    ]
+
+    job_postings = [near_duplicate(near_duplicate(new)), random_job_posting()]
+    r = client.post(
+        f"{settings.API_V1_STR}/job_postings/bulk",
+        json={"job_postings": job_postings},
+        params={"on_duplicate": "link"},
+    )
+    assert r.status_code == 200
+    assert [p["canonical_id"] for p in r.json()["data"]] == [new_id, None]
+
+
+def test_autocomplete_job_titles(client: TestClient, db: Session) -> None:
+    word = random_lower_string()
+    popular, other = (
+        client.post(
+            f"{settings.API_V1_STR}/job_postings/",
+            json={"title": f"{word} {suffix}", "description": random_lower_string()},
+        ).json()
+        for suffix in ("engineer", "designer")
+    )
+    user = create_random_user(db)
+    r = client.post(
+        f"{settings.API_V1_STR}/jobs/{popular['id']}/apply",
+        params={"user_id": str(user.id)},
+    )
+    assert r.status_code == 200
+
+    r = client.get(
+        f"{settings.API_V1_STR}/job_postings/autocomplete", params={"q": word[:10]}
+    )
+    assert r.status_code == 200
+    assert r.json() == [
+        {"title": popular["title"], "applicants": 1},
+        {"title": other["title"], "applicants": 0},
+    ]
+
+    client.delete(f"{settings.API_V1_STR}/job_postings/{other['id']}")
+    r = client.get(
+        f"{settings.API_V1_STR}/job_postings/autocomplete", params={"q": word}
+    )
+    assert [s["title"] for s in r.json()] == [popular["title"]]
+
+
+def test_search_job_postings(client: TestClient) -> None:
+    location = random_lower_string()
+    postings = [
+        {"employment_type": "full_time", "salary_min": 90_000, "salary_max": 120_000},
+        {"employment_type": "full_time", "salary_min": 50_000, "salary_max": 70_000},
+        {"employment_type": "contract"},
+    ]
+    ids = [
+        client.post(
+            f"{settings.API_V1_STR}/job_postings/",
+            json={**random_job_posting(), "location": location, **attributes},
+        ).json()["id"]
+        for attributes in postings
+    ]
+
+    r = client.get(
+        f"{settings.API_V1_STR}/job_postings/search",
+        params={"location": location, "limit": 2},
+    )
+    assert r.status_code == 200
+    content = r.json()
+    assert content["count"] == 3
+    # Newest first
+    assert [p["id"] for p in content["data"]] == [ids[2], ids[1]]
+    assert content["facets"]["location"] == [{"value": location, "count": 3}]
+    assert content["facets"]["employment_type"] == [
+        {"value": "full_time", "count": 2},
+        {"value": "contract", "count": 1},
+    ]
+
+    r = client.get(
+        f"{settings.API_V1_STR}/job_postings/search",
+        params={
+            "location": location,
+            "employment_type": "full_time",
+            "salary_min": 80_000,
+        },
+    )
+    content = r.json()
+    assert content["count"] == 1
+    assert [p["id"] for p in content["data"]] == [ids[0]]
+    assert content["data"][0]["salary_max"] == 120_000
+
+
+def test_create_job_posting_invalid_salary_range(client: TestClient) -> None:
+    r = client.post(
+        f"{settings.API_V1_STR}/job_postings/",
+        json={**random_job_posting(), "salary_min": 10, "salary_max": 5},
+    )
+    assert r.status_code == 422
+
+
+def test_read_job_postings_created_between(client: TestClient) -> None:
+    first, second = (
+        client.post(
+            f"{settings.API_V1_STR}/job_postings/", json=random_job_posting()
+        ).json()
+        for _ in range(2)
+    )
+    assert first["created_at"] <= second["created_at"]
+
+    r = client.get(
+        f"{settings.API_V1_STR}/job_postings/",
+        params={"since": second["created_at"]},
+    )
+    ids = [p["id"] for p in r.json()]
+    assert second["id"] in ids
+    assert first["id"] not in ids
+
+    r = client.get(
+        f"{settings.API_V1_STR}/job_postings/",
+        params={"until": first["created_at"]},
+    )
+    ids = [p["id"] for p in r.json()]
+    assert first["id"] not in ids and second["id"] not in ids
+
+
+def test_update_job_posting_sets_updated_at(client: TestClient) -> None:
+    job_posting = client.post(
+        f"{settings.API_V1_STR}/job_postings/", json=random_job_posting()
+    ).json()
+
+    r = client.put(
+        f"{settings.API_V1_STR}/job_postings/{job_posting['id']}",
+        json=random_job_posting(),
+    )
+    assert r.status_code == 200
+    updated = r.json()
+    assert updated["created_at"] == job_posting["created_at"]
+    assert updated["updated_at"] > job_posting["updated_at"]
@@ -0,0 +1,135 @@
+import json
+import uuid
+
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.models import JobPosting, UserJob
+from app.tests.utils.user import create_random_user
+from app.tests.utils.utils import random_lower_string
+
+
+def test_get_recommended_jobs(client: TestClient, db: Session) -> None:
+    user = create_random_user(db)
+    team, product, skill = (random_lower_string() for _ in range(3))
+    postings = [
+        {"title": f"{product} engineer", "description": f"{skill} for {team}"},
+        {"title": f"{team} developer", "description": f"{product} and {skill}"},
+        {"title": random_lower_string(), "description": random_lower_string()},
+    ]
+    ids = [
+        client.post(f"{settings.API_V1_STR}/job_postings/", json=p).json()["id"]
+        for p in postings
+    ]
+    r = client.post(
+        f"{settings.API_V1_STR}/jobs/{ids[0]}/apply", params={"user_id": user.id}
+    )
+    assert r.status_code == 200
+
+    r = client.get(
+        f"{settings.API_V1_STR}/jobs/recommendations", params={"user_id": user.id}
+    )
+    assert r.status_code == 200
+    recommended = [job["id"] for job in r.json()]
+    assert recommended[0] == ids[1]
+    assert ids[0] not in recommended
+    assert ids[2] not in recommended
+
+
+def test_get_recommended_jobs_user_not_found(client: TestClient) -> None:
+    r = client.get(
+        f"{settings.API_V1_STR}/jobs/recommendations",
+        params={"user_id": str(uuid.uuid4())},
+    )
+    assert r.status_code == 404
+
+
+def test_get_user_applications_page(client: TestClient, db: Session) -> None:
+    user = create_random_user(db)
+    job_ids = []
+    for _ in range(5):
+        job_posting = JobPosting(
+            title=random_lower_string(), description=random_lower_string()
+        )
+        db.add(job_posting)
+        db.add(UserJob(user_id=user.id, job_posting_id=job_posting.id))
+        job_ids.append(str(job_posting.id))
+    db.commit()
+
+    url = f"{settings.API_V1_STR}/jobs/applications/{user.id}/page"
+    r = client.get(url, params={"limit": 2})
+    assert r.status_code == 200
+    content = r.json()
+    pages = [content["data"]]
+    while content["next_cursor"]:
+        r = client.get(url, params={"limit": 2, "after": content["next_cursor"]})
+        content = r.json()
+        pages.append(content["data"])
+
+    assert [len(page) for page in pages] == [2, 2, 1]
+    applications = [a for page in pages for a in page]
+    assert sorted(a["job_id"] for a in applications) == sorted(job_ids)
+    assert "job_description" not in applications[0]
+
+    r = client.get(url, params={"include_description": True})
+    assert all("job_description" in a for a in r.json()["data"])
+
+
+def test_stream_user_applications(client: TestClient, db: Session) -> None:
+    user = create_random_user(db)
+    job_posting = JobPosting(title=random_lower_string(), description="Remote")
+    db.add(job_posting)
+    db.add(UserJob(user_id=user.id, job_posting_id=job_posting.id))
+    db.commit()
+
+    r = client.get(
+        f"{settings.API_V1_STR}/jobs/applications/{user.id}/stream",
+        params={"include_description": True},
+    )
+    assert r.status_code == 200
+    assert r.headers["content-type"] == "application/x-ndjson"
+    applications = [json.loads(line) for line in r.text.splitlines()]
+    assert len(applications) == 1
+    assert applications[0]["job_id"] == str(job_posting.id)
+    assert applications[0]["job_description"] == "Remote"
+
+    r = client.get(f"{settings.API_V1_STR}/jobs/applications/{uuid.uuid4()}/stream")
+    assert r.status_code == 404
+
+
+def test_get_user_applications_applied_between(client: TestClient, db: Session) -> None:
+    user = create_random_user(db)
+    job_posting = JobPosting(title=random_lower_string(), description="Remote")
+    db.add(job_posting)
+    application = UserJob(user_id=user.id, job_posting_id=job_posting.id)
+    db.add(application)
+    db.commit()
+    db.refresh(application)
+    assert application.created_at is not None
+
+    url = f"{settings.API_V1_STR}/jobs/applications/{user.id}"
+    r = client.get(url, params={"since": application.created_at.isoformat()})
+    assert [a["application_id"] for a in r.json()] == [str(application.id)]
+    assert r.json()[0]["applied_at"] == application.created_at.isoformat()
+    r = client.get(url, params={"until": application.created_at.isoformat()})
+    assert r.json() == []
+
+
+def test_update_application_status(client: TestClient, db: Session) -> None:
+    user = create_random_user(db)
+    job_posting = JobPosting(title=random_lower_string(), description="Remote")
+    db.add(job_posting)
+    db.add(UserJob(user_id=user.id, job_posting_id=job_posting.id))
+    db.commit()
+
+    url = f"{settings.API_V1_STR}/jobs/{job_posting.id}/status"
+    r = client.put(url, params={"user_id": str(user.id), "status": "interviewing"})
+    assert r.status_code == 200
+    assert r.json()["status"] == "interviewing"
+    assert r.json()["previous_status"] == "applied"
+
+    r = client.put(url, params={"user_id": str(user.id), "status": "hired?"})
+    assert r.status_code == 422
+    r = client.put(url, params={"user_id": str(uuid.uuid4()), "status": "offered"})
+    assert r.status_code == 404
@@ -7,7 +7,7 @@ from sqlmodel import Session, select
 from app import crud
 from app.core.config import settings
 from app.core.security import verify_password
-from app.models import User, UserCreate
+from app.models import DeletionJob, Item, JobPosting, User, UserCreate, UserJob
 from app.tests.utils.utils import random_email, random_lower_string
 
 
@@ -146,6 +146,78 @@ def test_create_user_by_normal_user(
     assert r.status_code == 403
 
 
+def test_create_users_bulk(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    existing = random_email()
+    crud.create_user(
+        session=db,
+        user_create=UserCreate(email=existing, password=random_lower_string()),
+    )
+    new_emails = [random_email(), random_email()]
+    data = {
+        "users": [
+            {"email": email, "password": random_lower_string()}
+            for email in [*new_emails, new_emails[0], existing]
+        ]
+    }
+    r = client.post(
+        f"{settings.API_V1_STR}/users/bulk",
+        headers=superuser_token_headers,
+        json=data,
+    )
+    assert r.status_code == 200
+    content = r.json()
+    assert content["created"] == 2
+    assert sorted(content["skipped"]) == sorted([new_emails[0], existing])
+    for email in new_emails:
+        assert crud.get_user_by_email(session=db, email=email)
+
+
+def test_create_users_bulk_csv(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    email = random_email()
+    password = random_lower_string()
+    csv_data = f"email,password,full_name\n{email},{password},Bulk User\n"
+    r = client.post(
+        f"{settings.API_V1_STR}/users/bulk/csv",
+        headers=superuser_token_headers,
+        files={"file": ("users.csv", csv_data, "text/csv")},
+    )
+    assert r.status_code == 200
+    assert r.json() == {"created": 1, "skipped": []}
+    user = crud.get_user_by_email(session=db, email=email)
+    assert user
+    assert user.full_name == "Bulk User"
+    assert verify_password(password, user.hashed_password)
+
+
+def test_create_users_bulk_csv_invalid_row(
+    client: TestClient, superuser_token_headers: dict[str, str]
+) -> None:
+    csv_data = "email,password\nnot-an-email,short\n"
+    r = client.post(
+        f"{settings.API_V1_STR}/users/bulk/csv",
+        headers=superuser_token_headers,
+        files={"file": ("users.csv", csv_data, "text/csv")},
+    )
+    assert r.status_code == 422
+    assert r.json()["detail"][0].startswith("Line 2:")
+
+
+def test_create_users_bulk_by_normal_user(
+    client: TestClient, normal_user_token_headers: dict[str, str]
+) -> None:
+    data = {"users": [{"email": random_email(), "password": random_lower_string()}]}
+    r = client.post(
+        f"{settings.API_V1_STR}/users/bulk",
+        headers=normal_user_token_headers,
+        json=data,
+    )
+    assert r.status_code == 403
+
+
 def test_retrieve_users(
     client: TestClient, superuser_token_headers: dict[str, str], db: Session
 ) -> None:
@@ -484,3 +556,63 @@ def test_delete_user_without_privileges(
     )
     assert r.status_code == 403
     assert r.json()["detail"] == "The user doesn't have enough privileges"
+
+
+def test_delete_user_in_background(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    user = crud.create_user(
+        session=db,
+        user_create=UserCreate(email=random_email(), password=random_lower_string()),
+    )
+    user_id = user.id
+    job_posting = JobPosting(title="Engineer", description="Build things")
+    db.add(job_posting)
+    db.add(UserJob(user_id=user_id, job_posting_id=job_posting.id))
+    for i in range(5):
+        db.add(Item(title=f"item {i}", owner_id=user_id))
+    db.commit()
+
+    with patch("app.core.config.settings.DELETION_CHUNK_SIZE", 2):
+        r = client.post(
+            f"{settings.API_V1_STR}/users/{user_id}/deletion",
+            headers=superuser_token_headers,
+        )
+    assert r.status_code == 202
+    job = r.json()
+    assert job["target_id"] == str(user_id)
+
+    r = client.get(
+        f"{settings.API_V1_STR}/deletion-jobs/{job['id']}",
+        headers=superuser_token_headers,
+    )
+    assert r.status_code == 200
+    assert r.json()["status"] == "done"
+    assert r.json()["deleted_rows"] == 7
+    db.expire_all()
+    assert db.get(User, user_id) is None
+    assert db.exec(select(Item).where(Item.owner_id == user_id)).first() is None
+    assert db.exec(select(UserJob).where(UserJob.user_id == user_id)).first() is None
+    assert db.get(DeletionJob, job["id"])
+
+
+def test_delete_user_in_background_hides_user(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    user = crud.create_user(
+        session=db,
+        user_create=UserCreate(email=random_email(), password=random_lower_string()),
+    )
+    with patch("app.api.routes.users.run_deletion_job"):
+        r = client.post(
+            f"{settings.API_V1_STR}/users/{user.id}/deletion",
+            headers=superuser_token_headers,
+        )
+    assert r.status_code == 202
+    assert r.json()["status"] == "pending"
+
+    r = client.get(
+        f"{settings.API_V1_STR}/users/{user.id}",
+        headers=superuser_token_headers,
+    )
+    assert r.status_code == 404
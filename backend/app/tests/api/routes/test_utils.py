@@ -0,0 +1,50 @@
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.core.health import health_probe
+
+
+def test_liveness(client: TestClient) -> None:
+    r = client.get(f"{settings.API_V1_STR}/utils/health/live/")
+    assert r.status_code == 200
+    assert r.json() is True
+
+
+def test_readiness(client: TestClient) -> None:
+    r = client.get(f"{settings.API_V1_STR}/utils/health/ready/")
+    assert r.status_code == 200
+    content = r.json()
+    assert content["ready"] is True
+    assert content["database_reachable"] is True
+    assert content["pool_capacity"] == (
+        settings.POSTGRES_POOL_SIZE + settings.POSTGRES_MAX_OVERFLOW
+    )
+    assert content["checked_at"]
+
+
+def test_readiness_email_backlog(client: TestClient) -> None:
+    with patch("app.core.config.settings.HEALTH_MAX_EMAIL_BACKLOG", 0):
+        health_probe.check()
+        r = client.get(f"{settings.API_V1_STR}/utils/health/ready/")
+    assert r.status_code == 503
+    assert r.json()["ready"] is False
+    health_probe.check()
+
+
+def test_readiness_stale_probe(client: TestClient) -> None:
+    with patch.object(health_probe, "interval", -1):
+        r = client.get(f"{settings.API_V1_STR}/utils/health/ready/")
+    assert r.status_code == 503
+
+
+def test_metrics(client: TestClient) -> None:
+    client.get(
+        f"{settings.API_V1_STR}/openapi.json", headers={"Accept-Encoding": "gzip"}
+    )
+    r = client.get(f"{settings.API_V1_STR}/utils/metrics/")
+    assert r.status_code == 200
+    compression = r.json()["compression"]
+    assert compression["bytes_saved"] > 0
+    assert compression["compression_seconds"] > 0
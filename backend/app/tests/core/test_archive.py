@@ -0,0 +1,117 @@
+from datetime import datetime, timedelta, timezone
+
+from fastapi.testclient import TestClient
+from sqlmodel import Session, col, select
+
+from app.core.archive import archive_applications
+from app.core.config import settings
+from app.models import JobPosting, User, UserJob, UserJobArchive
+from app.tests.utils.user import create_random_user
+from app.tests.utils.utils import random_lower_string
+
+
+def create_applications(
+    db: Session, user: User, closed_days_ago: int | None
+) -> JobPosting:
+    closed_at = (
+        datetime.now(timezone.utc) - timedelta(days=closed_days_ago)
+        if closed_days_ago is not None
+        else None
+    )
+    job_posting = JobPosting(
+        title=random_lower_string(), description="Remote", closed_at=closed_at
+    )
+    db.add(job_posting)
+    db.add(UserJob(user_id=user.id, job_posting_id=job_posting.id))
+    for _ in range(4):
+        db.add(
+            UserJob(user_id=create_random_user(db).id, job_posting_id=job_posting.id)
+        )
+    db.commit()
+    return job_posting
+
+
+def test_archive_applications(db: Session) -> None:
+    user = create_random_user(db)
+    old = create_applications(db, user, closed_days_ago=30)
+    recent = create_applications(db, user, closed_days_ago=1)
+    still_open = create_applications(db, user, closed_days_ago=None)
+    hot_before = db.exec(select(UserJob).where(UserJob.job_posting_id == old.id)).all()
+
+    cutoff = datetime.now(timezone.utc) - timedelta(days=7)
+    assert archive_applications(cutoff=cutoff, chunk_size=2) >= 5
+
+    db.expire_all()
+    for job_posting, archived in [(old, 5), (recent, 0), (still_open, 0)]:
+        hot = db.exec(
+            select(UserJob).where(UserJob.job_posting_id == job_posting.id)
+        ).all()
+        cold = db.exec(
+            select(UserJobArchive).where(
+                UserJobArchive.job_posting_id == job_posting.id
+            )
+        ).all()
+        assert (len(hot), len(cold)) == (5 - archived, archived)
+    cold = db.exec(
+        select(UserJobArchive)
+        .where(UserJobArchive.job_posting_id == old.id)
+        .order_by(col(UserJobArchive.id))
+    ).all()
+    assert [(a.id, a.user_id, a.created_at) for a in cold] == sorted(
+        (a.id, a.user_id, a.created_at) for a in hot_before
+    )
+    assert archive_applications(cutoff=cutoff) == 0
+
+
+def test_read_archived_applications(client: TestClient, db: Session) -> None:
+    user = create_random_user(db)
+    old = create_applications(db, user, closed_days_ago=400)
+    current = create_applications(db, user, closed_days_ago=None)
+    archive_applications()
+    url = f"{settings.API_V1_STR}/jobs/applications/{user.id}"
+
+    r = client.get(url)
+    assert [a["job_id"] for a in r.json()] == [str(current.id)]
+    r = client.get(url, params={"include_archived": True})
+    assert {a["job_id"] for a in r.json()} == {str(old.id), str(current.id)}
+
+    r = client.get(f"{url}/page", params={"include_archived": True, "limit": 1})
+    first = r.json()
+    assert len(first["data"]) == 1
+    r = client.get(
+        f"{url}/page",
+        params={"include_archived": True, "after": first["next_cursor"]},
+    )
+    second = r.json()
+    assert second["next_cursor"] is None
+    assert {a["job_id"] for a in first["data"] + second["data"]} == {
+        str(old.id),
+        str(current.id),
+    }
+
+    r = client.get(f"{url}/stream", params={"include_archived": True})
+    assert len(r.text.splitlines()) == 2
+
+    details = f"{settings.API_V1_STR}/jobs/{old.id}"
+    r = client.get(details, params={"user_id": str(user.id)})
+    assert r.json()["has_applied"] is False
+    r = client.get(details, params={"user_id": str(user.id), "include_archived": True})
+    assert r.json()["has_applied"] is True
+
+
+def test_apply_to_closed_job_posting(client: TestClient, db: Session) -> None:
+    user = create_random_user(db)
+    job_posting = JobPosting(title=random_lower_string(), description="Remote")
+    db.add(job_posting)
+    db.commit()
+
+    r = client.post(f"{settings.API_V1_STR}/job_postings/{job_posting.id}/close")
+    assert r.status_code == 200
+    assert r.json()["closed_at"]
+    r = client.post(
+        f"{settings.API_V1_STR}/jobs/{job_posting.id}/apply",
+        params={"user_id": str(user.id)},
+    )
+    assert r.status_code == 400
+    r = client.get(f"{settings.API_V1_STR}/jobs/", params={"user_id": str(user.id)})
+    assert str(job_posting.id) not in {job["id"] for job in r.json()}
@@ -0,0 +1,99 @@
+import json
+
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.core.compression import (
+    CompressionMiddleware,
+    choose_encoding,
+    compression_metrics,
+)
+
+ITEMS = [
+    {"id": i, "title": "Backend engineer", "description": "x" * 50} for i in range(200)
+]
+
+
+def make_client(cpu_budget: float = 1.0) -> TestClient:
+    app = FastAPI()
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=1024,
+        cpu_budget=cpu_budget,
+        cache_bytes=1024 * 1024,
+    )
+
+    @app.get("/large")
+    def large() -> list[dict[str, object]]:
+        return ITEMS
+
+    @app.get("/small")
+    def small() -> dict[str, str]:
+        return {"status": "ok"}
+
+    @app.get("/stream")
+    def stream() -> StreamingResponse:
+        return StreamingResponse(
+            iter(["a" * 2000, "b" * 2000]), media_type="text/plain"
+        )
+
+    return TestClient(app)
+
+
+def test_choose_encoding() -> None:
+    assert choose_encoding("gzip, deflate") == "gzip"
+    assert choose_encoding("gzip;q=0, deflate") is None
+    assert choose_encoding("identity") is None
+
+
+def test_large_responses_are_compressed() -> None:
+    client = make_client()
+    r = client.get("/large", headers={"Accept-Encoding": "gzip"})
+    assert r.status_code == 200
+    assert r.headers["content-encoding"] == "gzip"
+    assert r.headers["vary"] == "Accept-Encoding"
+    assert int(r.headers["content-length"]) < len(json.dumps(ITEMS)) / 10
+    assert r.json() == ITEMS
+
+
+def test_small_and_streamed_responses_are_not_compressed() -> None:
+    client = make_client()
+    r = client.get("/small", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in r.headers
+    assert r.json() == {"status": "ok"}
+    r = client.get("/stream", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in r.headers
+    assert r.text == "a" * 2000 + "b" * 2000
+
+
+def test_unchanged_responses_reuse_compressed_body() -> None:
+    client = make_client()
+    before = compression_metrics()
+    first = client.get("/large", headers={"Accept-Encoding": "gzip"})
+    second = client.get("/large", headers={"Accept-Encoding": "gzip"})
+    after = compression_metrics()
+    assert second.headers["etag"] == first.headers["etag"]
+    assert second.headers["content-length"] == first.headers["content-length"]
+    assert after.responses_compressed == before.responses_compressed + 1
+    assert after.cache_hits == before.cache_hits + 1
+    assert after.bytes_saved > before.bytes_saved
+    assert after.compression_seconds > before.compression_seconds
+
+
+def test_matching_etag_is_not_modified() -> None:
+    client = make_client()
+    etag = client.get("/large").headers["etag"]
+    r = client.get("/large", headers={"If-None-Match": etag})
+    assert r.status_code == 304
+    assert r.content == b""
+    assert r.headers["etag"] == etag
+
+
+def test_compression_stops_when_over_budget() -> None:
+    client = make_client(cpu_budget=0.0)
+    before = compression_metrics()
+    r = client.get("/large", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in r.headers
+    assert r.json() == ITEMS
+    assert compression_metrics().skipped_over_budget == before.skipped_over_budget + 1
@@ -0,0 +1,56 @@
+import uuid
+
+from app.core.duplicates import (
+    DuplicateIndex,
+    estimated_similarity,
+    shingles,
+    signature,
+)
+
+DESCRIPTION = (
+    "We are hiring a backend engineer to design and operate the Python services "
+    "behind our hiring platform, working with PostgreSQL, Redis and Kubernetes "
+    "alongside a small team of product engineers and designers"
+)
+
+
+def test_signature_similarity() -> None:
+    original = signature(shingles("Backend engineer", DESCRIPTION))
+    reposted = signature(shingles("Backend engineer", f"{DESCRIPTION} remotely"))
+    unrelated = signature(
+        shingles("Pastry chef", "Bake bread and croissants every morning")
+    )
+    assert original is not None and reposted is not None and unrelated is not None
+    assert estimated_similarity(original, original) == 1
+    assert estimated_similarity(original, reposted) > 0.8
+    assert estimated_similarity(original, unrelated) < 0.3
+    assert signature(shingles("", "")) is None
+
+
+def test_find() -> None:
+    index = DuplicateIndex()
+    original, unrelated = uuid.uuid4(), uuid.uuid4()
+    index.rebuild(
+        [
+            (original, "Backend engineer", DESCRIPTION),
+            (unrelated, "Pastry chef", "Bake bread and croissants every morning"),
+        ]
+    )
+    match = index.find("Backend engineer", f"{DESCRIPTION} remotely", 0.8)
+    assert match is not None and match[0] == original
+    assert index.find("Backend engineer", DESCRIPTION, 0.8, exclude=original) is None
+    assert index.find("Data scientist", "Forecast demand with Spark", 0.8) is None
+
+
+def test_incremental_updates() -> None:
+    index = DuplicateIndex()
+    first, second = uuid.uuid4(), uuid.uuid4()
+    index.add(first, "Backend engineer", DESCRIPTION)
+    index.add(second, "Pastry chef", "Bake bread and croissants every morning")
+    assert index.ids() == {first, second}
+
+    index.remove(first)
+    assert index.find("Backend engineer", DESCRIPTION, 0.8) is None
+    index.add(second, "Backend engineer", DESCRIPTION)
+    match = index.find("Backend engineer", DESCRIPTION, 0.8)
+    assert match == (second, 1.0)
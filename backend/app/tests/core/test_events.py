@@ -0,0 +1,71 @@
+import asyncio
+import json
+import uuid
+
+from sqlmodel import Session
+
+from app.core.db import engine
+from app.core.events import POSTING_DELETED, EventBroker, notify
+
+
+def test_broker_fans_out_committed_changes() -> None:
+    user_id = uuid.uuid4()
+    posting_id = str(uuid.uuid4())
+
+    async def scenario() -> None:
+        broker = EventBroker()
+        broker.start()
+        try:
+            assert await asyncio.to_thread(broker.listening.wait, 5.0)
+            _, everyone = broker.subscribe(None)
+            _, applicant = broker.subscribe(user_id)
+            _, other_user = broker.subscribe(uuid.uuid4())
+
+            with Session(engine) as session:
+                notify(session, "application.created", {"user_id": str(user_id)})
+                notify(session, POSTING_DELETED, {"id": "rolled back"})
+                session.rollback()
+                notify(session, "application.created", {"user_id": str(user_id)})
+                notify(session, POSTING_DELETED, {"id": posting_id})
+                session.commit()
+
+            message = await asyncio.wait_for(applicant.queue.get(), 5.0)
+            assert message.startswith("event: application.created\n")
+            message = await asyncio.wait_for(applicant.queue.get(), 5.0)
+            assert message.startswith(f"event: {POSTING_DELETED}\n")
+
+            message = await asyncio.wait_for(everyone.queue.get(), 5.0)
+            event_type, data = message.strip().split("\n")
+            assert event_type == f"event: {POSTING_DELETED}"
+            assert json.loads(data.removeprefix("data: ")) == {"id": posting_id}
+            assert everyone.queue.empty()
+            assert other_user.queue.qsize() == 1
+        finally:
+            await asyncio.to_thread(broker.stop)
+
+    asyncio.run(scenario())
+
+
+def test_broker_truncates_large_postings() -> None:
+    posting = {
+        "id": str(uuid.uuid4()),
+        "title": "Engineer",
+        "description": "x" * 10_000,
+    }
+
+    async def scenario() -> None:
+        broker = EventBroker()
+        broker.start()
+        try:
+            assert await asyncio.to_thread(broker.listening.wait, 5.0)
+            _, subscriber = broker.subscribe(None)
+            with Session(engine) as session:
+                notify(session, "posting.created", posting)
+                session.commit()
+            message = await asyncio.wait_for(subscriber.queue.get(), 5.0)
+            data = json.loads(message.strip().split("\n")[1].removeprefix("data: "))
+            assert data == {"id": posting["id"], "title": "Engineer", "truncated": True}
+        finally:
+            await asyncio.to_thread(broker.stop)
+
+    asyncio.run(scenario())
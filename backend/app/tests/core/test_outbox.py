@@ -0,0 +1,89 @@
+import json
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session, col, select
+
+from app.core.config import settings
+from app.core.outbox import LogFileSink, OutboxDispatcher, event_dict
+from app.models import JobPosting, OutboxEvent
+from app.tests.utils.user import create_random_user
+from app.tests.utils.utils import random_lower_string
+
+
+class RecordingSink:
+    name = "recording"
+
+    def __init__(self, fail: bool = False) -> None:
+        self.fail = fail
+        self.events: list[dict[str, Any]] = []
+
+    def send(self, events: Sequence[OutboxEvent]) -> None:
+        if self.fail:
+            raise RuntimeError("sink unavailable")
+        self.events.extend(event_dict(event) for event in events)
+
+
+def drain(dispatcher: OutboxDispatcher) -> None:
+    while dispatcher.dispatch_batch():
+        pass
+
+
+def apply_and_change_status(client: TestClient, db: Session) -> JobPosting:
+    user = create_random_user(db)
+    job_posting = JobPosting(title=random_lower_string(), description="Remote")
+    db.add(job_posting)
+    db.commit()
+    params = {"user_id": str(user.id)}
+    r = client.post(f"{settings.API_V1_STR}/jobs/{job_posting.id}/apply", params=params)
+    assert r.status_code == 200
+    r = client.put(
+        f"{settings.API_V1_STR}/jobs/{job_posting.id}/status",
+        params={**params, "status": "reviewing"},
+    )
+    assert r.status_code == 200
+    return job_posting
+
+
+def test_dispatch_in_order(client: TestClient, db: Session, tmp_path: Path) -> None:
+    job_posting = apply_and_change_status(client, db)
+    sink = RecordingSink()
+    log_path = tmp_path / "outbox.log"
+    drain(OutboxDispatcher([sink, LogFileSink(str(log_path))], 100, 1.0))
+
+    events = [
+        e for e in sink.events if e["data"]["job_posting_id"] == str(job_posting.id)
+    ]
+    assert [e["type"] for e in events] == [
+        "application.created",
+        "application.status_changed",
+    ]
+    assert events[1]["data"]["previous_status"] == "applied"
+    assert events[1]["data"]["status"] == "reviewing"
+
+    logged = [json.loads(line) for line in log_path.read_text().splitlines()]
+    assert [
+        e["id"] for e in logged if e["data"]["job_posting_id"] == str(job_posting.id)
+    ] == [e["id"] for e in events]
+
+
+def test_failed_dispatch_is_retried(client: TestClient, db: Session) -> None:
+    job_posting = apply_and_change_status(client, db)
+    statement = select(OutboxEvent).where(
+        col(OutboxEvent.job_posting_id) == job_posting.id
+    )
+
+    with pytest.raises(RuntimeError):
+        OutboxDispatcher([RecordingSink(fail=True)], 100, 1.0).dispatch_batch()
+    db.expire_all()
+    events = db.exec(statement).all()
+    assert all(e.dispatched_at is None for e in events)
+
+    sink = RecordingSink()
+    drain(OutboxDispatcher([sink], 100, 1.0))
+    assert {e.id for e in events} <= {e["id"] for e in sink.events}
+    db.expire_all()
+    assert all(e.dispatched_at is not None for e in db.exec(statement).all())
@@ -0,0 +1,43 @@
+import uuid
+
+from app.core.similarity import SimilarityIndex, tokenize
+
+
+def test_tokenize() -> None:
+    assert tokenize("Senior C++ Engineer, and the Team!") == [
+        "senior",
+        "c++",
+        "engineer",
+        "team",
+    ]
+
+
+def test_similar_to() -> None:
+    index = SimilarityIndex()
+    backend, backend_2, designer = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    index.rebuild(
+        [
+            (backend, "Backend engineer", "Python APIs with PostgreSQL"),
+            (backend_2, "Python developer", "Build APIs on PostgreSQL"),
+            (designer, "Product designer", "Figma prototypes and user research"),
+        ]
+    )
+    results = index.similar_to([backend], 10)
+    assert [posting_id for posting_id, _ in results] == [backend_2]
+    assert 0 < results[0][1] <= 1
+
+
+def test_incremental_updates() -> None:
+    index = SimilarityIndex()
+    first, second = uuid.uuid4(), uuid.uuid4()
+    index.add(first, "Data engineer", "Spark pipelines")
+    index.add(second, "Chef", "Italian cuisine")
+    assert index.similar_to([first], 10) == []
+
+    index.add(second, "Data engineer", "Airflow and Spark pipelines")
+    assert [posting_id for posting_id, _ in index.similar_to([first], 10)] == [second]
+    assert index.title(second) == "Data engineer"
+
+    index.remove(second)
+    assert second not in index
+    assert index.similar_to([first], 10) == []
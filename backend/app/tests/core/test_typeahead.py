@@ -0,0 +1,49 @@
+import uuid
+
+from app.core.typeahead import TitleIndex, title_keys
+
+
+def test_title_keys() -> None:
+    assert title_keys("Senior  C++ Engineer") == [
+        "senior c++ engineer",
+        "c++ engineer",
+        "engineer",
+    ]
+
+
+def test_complete_ranks_by_applicants() -> None:
+    index = TitleIndex()
+    backend, backend_2, frontend, chef = (uuid.uuid4() for _ in range(4))
+    index.rebuild(
+        [
+            (backend, "Backend Engineer", ""),
+            (backend_2, "backend engineer", ""),
+            (frontend, "Frontend Engineer", ""),
+            (chef, "Chef", ""),
+        ]
+    )
+    index.set_applicants({backend: 1, backend_2: 1, frontend: 3})
+
+    assert index.complete("eng", 10) == [
+        ("Frontend Engineer", 3),
+        ("Backend Engineer", 2),
+    ]
+    assert index.complete("BACK", 10)[0][1] == 2
+    assert index.complete("eng", 1) == [("Frontend Engineer", 3)]
+    assert index.complete("x", 10) == []
+    assert index.complete(" ", 10) == []
+
+
+def test_incremental_updates() -> None:
+    index = TitleIndex()
+    first, second = uuid.uuid4(), uuid.uuid4()
+    index.add(first, "Data engineer", "")
+    index.add(second, "Data analyst", "")
+    index.add_applicant(second)
+    assert index.complete("data", 10) == [("Data analyst", 1), ("Data engineer", 0)]
+
+    index.add(second, "Chef", "")
+    index.remove(first)
+    assert index.complete("data", 10) == []
+    assert index.complete("chef", 10) == [("Chef", 1)]
+    assert len(index) == 1
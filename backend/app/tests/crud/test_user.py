@@ -89,3 +89,22 @@ def test_update_user(db: Session) -> None:
     assert user_2
     assert user.email == user_2.email
     assert verify_password(new_password, user_2.hashed_password)
+
+
+def test_create_users(db: Session) -> None:
+    emails = [random_email() for _ in range(40)]
+    users_in = [
+        UserCreate(email=email, password=random_lower_string()) for email in emails
+    ]
+    created, skipped = crud.create_users(
+        session=db, users_create=[*users_in, users_in[0]], batch_size=16
+    )
+    assert [user.email for user in created] == emails
+    assert skipped == [emails[0]]
+    user = crud.get_user_by_email(session=db, email=emails[-1])
+    assert user
+    assert verify_password(users_in[-1].password, user.hashed_password)
+
+    created, skipped = crud.create_users(session=db, users_create=users_in[:2])
+    assert created == []
+    assert skipped == emails[:2]
@@ -0,0 +1,14 @@
+from app.startup_profile import parse_import_times
+
+
+def test_parse_import_times() -> None:
+    output = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 |     jinja2.utils\n"
+        "import time:      1500 |       2000 |   jinja2\n"
+        "some unrelated warning\n"
+    )
+    assert parse_import_times(output) == [
+        ("jinja2.utils", 0.12, 0.12),
+        ("jinja2", 1.5, 2.0),
+    ]
@@ -4,9 +4,7 @@ from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
 
-import emails  # type: ignore
 import jwt
-from jinja2 import Template
 from jwt.exceptions import InvalidTokenError
 
 from app.core import security
@@ -23,6 +21,9 @@ class EmailData:
 
 
 def render_email_template(*, template_name: str, context: dict[str, Any]) -> str:
+    # Imported on first use, most workers never render an email
+    from jinja2 import Template
+
     template_str = (
         Path(__file__).parent / "email-templates" / "build" / template_name
     ).read_text()
@@ -37,6 +38,8 @@ def send_email(
     html_content: str = "",
 ) -> None:
     assert settings.emails_enabled, "no provided configuration for email variables"
+    import emails  # type: ignore
+
     message = emails.Message(
         subject=subject,
         html=html_content,
@@ -100,6 +103,23 @@ def generate_new_account_email(
     return EmailData(html_content=html_content, subject=subject)
 
 
+def generate_application_events_email(
+    email_to: str, events: list[dict[str, Any]]
+) -> EmailData:
+    project_name = settings.PROJECT_NAME
+    subject = f"{project_name} - {len(events)} application updates"
+    html_content = render_email_template(
+        template_name="application_events.html",
+        context={
+            "project_name": settings.PROJECT_NAME,
+            "email": email_to,
+            "events": events,
+            "link": settings.FRONTEND_HOST,
+        },
+    )
+    return EmailData(html_content=html_content, subject=subject)
+
+
 def generate_password_reset_token(email: str) -> str:
     delta = timedelta(hours=settings.EMAIL_RESET_TOKEN_EXPIRE_HOURS)
     now = datetime.now(timezone.utc)
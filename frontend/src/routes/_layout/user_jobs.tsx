@@ -38,6 +38,50 @@ function UserJobsPage() {
     }
   }, [currentUser])
 
+  // Apply live changes instead of refetching the whole list
+  useEffect(() => {
+    if (!currentUser?.id) return
+    const events = new EventSource(`http://localhost:8000/api/v1/events/stream?user_id=${currentUser.id}`)
+
+    events.addEventListener("posting.created", (event) => {
+      const posting = JSON.parse((event as MessageEvent).data)
+      if (posting.canonical_id) return
+      setJobs(prevJobs =>
+        prevJobs.some(job => job.id === posting.id)
+          ? prevJobs
+          : [...prevJobs, { id: posting.id, title: posting.title, description: posting.description ?? "", has_applied: false, user_id: null }]
+      )
+    })
+    events.addEventListener("posting.updated", (event) => {
+      const posting = JSON.parse((event as MessageEvent).data)
+      setJobs(prevJobs =>
+        prevJobs.map(job =>
+          job.id === posting.id
+            ? { ...job, title: posting.title, description: posting.description ?? job.description }
+            : job
+        )
+      )
+    })
+    events.addEventListener("posting.deleted", (event) => {
+      const { id } = JSON.parse((event as MessageEvent).data)
+      setJobs(prevJobs => prevJobs.filter(job => job.id !== id))
+    })
+    const markApplied = (event: Event) => {
+      const { job_posting_id } = JSON.parse((event as MessageEvent).data)
+      setJobs(prevJobs =>
+        prevJobs.map(job =>
+          job.id === job_posting_id ? { ...job, has_applied: true } : job
+        )
+      )
+    }
+    events.addEventListener("application.created", markApplied)
+    events.addEventListener("application.status_changed", markApplied)
+    // Sent when this stream missed events, the list may be stale
+    events.addEventListener("resync", () => fetchJobs())
+
+    return () => events.close()
+  }, [currentUser?.id])
+
   const fetchJobs = async () => {
     try {
       setIsLoading(true)